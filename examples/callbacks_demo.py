@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+HID Origo Callbacks & Events - Part 4 Walkthrough
+=================================================
+
+Answers the Part 4 questions using the mock Callback API:
+registration, event filtering, recovery and payload interpretation.
+
+Run: python -m examples.callbacks_demo
+"""
+import logging
+import sys
+from pathlib import Path
+
+from src.api import callbacks
+from src.api.auth import MockOrigoAuth
+from src.api.callbacks import (
+    MockCallbackAPI,
+    CallbackRegistration,
+    CallbackRecovery,
+    CloudEvent,
+    EventFilter
+)
+from src.utils.serialization import dumps_pretty
+
+
+def main():
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
+
+    print("\n" + "="*70)
+    print("HID ORIGO CALLBACKS & EVENTS DEMO")
+    print("="*70)
+
+    # Mock auth
+    auth = MockOrigoAuth(
+        organization_id="demo-org-123",
+        client_id="demo-client-id",
+        client_secret="demo-secret"
+    )
+    auth.authenticate()
+
+    # Mock callback API
+    callback_api = MockCallbackAPI(auth)
+
+    # Question 2: Register a callback
+    print("\n" + "="*70)
+    print("QUESTION 2: Callback Registration Flow")
+    print("="*70)
+
+    registration = CallbackRegistration(
+        url="https://acme.com/webhooks/origo",
+        filter=EventFilter.user_events_only(),  # Question 3: Filter for user events
+        http_header="Authorization",
+        secret="Bearer my-secret-token"
+    )
+
+    callback_api.register_callback(registration)
+
+    # Question 3: Event filter example
+    print("\n" + "="*70)
+    print("QUESTION 3: Event Filtering")
+    print("="*70)
+    print("\nFilter for only user management events:")
+    user_filter = EventFilter.user_events_only()
+    print(f"  eventTypes: {list(user_filter.event_types)}")
+
+    # Question 4: Recovery explanation
+    print("\n" + "="*70)
+    print("QUESTION 4: Troubleshooting Failed Callbacks")
+    print("="*70)
+    print(CallbackRecovery.explain_recovery())
+
+    # Question 5: Event interpretation
+    print("\n" + "="*70)
+    print("QUESTION 5: Event Payload Interpretation")
+    print("="*70)
+
+    example_event = {
+        "type": "PASS_UPDATED",
+        "subject": "pass/45d3d21e-xxxx",
+        "time": "2025-11-10T14:05:00Z",
+        "data": {
+            "status": "COMPLETED",
+            "userId": "b47d-56f8-8bcd",
+            "organizationId": "7521464"
+        }
+    }
+
+    print("\nExample Event Payload:")
+    print(dumps_pretty(example_event))
+
+    event = CloudEvent.from_dict(example_event)
+    print("\nInterpretation:")
+    print(event.interpret())
+
+    # Show the Flask webhook receiver (src/api/webhook.py)
+    print("\n" + "="*70)
+    print("WEBHOOK HANDLER EXAMPLE (Flask)")
+    print("="*70)
+    print(Path(callbacks.__file__).with_name("webhook.py").read_text())
+
+
+if __name__ == "__main__":
+    main()
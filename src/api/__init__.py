@@ -1,6 +1,15 @@
 from .auth import OrigoAuth
-from .users import UserManagementAPI
-from .credentials import CredentialManagementAPI
-from .callbacks import CallbackAPI
+from .users import UserManagementAPI, AsyncUserManagementAPI
+from .credentials import CredentialManagementAPI, AsyncCredentialManagementAPI
+from .callbacks import CallbackAPI, AsyncCallbackAPI, EventDispatcher
 
-__all__ = ["OrigoAuth", "UserManagementAPI", "CredentialManagementAPI", "CallbackAPI"]
+__all__ = [
+    "OrigoAuth",
+    "UserManagementAPI",
+    "CredentialManagementAPI",
+    "CallbackAPI",
+    "AsyncUserManagementAPI",
+    "AsyncCredentialManagementAPI",
+    "AsyncCallbackAPI",
+    "EventDispatcher",
+]
@@ -11,28 +11,56 @@ Key Concepts:
 - Tokens become invalid after 5 minutes of inactivity
 - All API calls require: Authorization, Application-ID, Application-Version headers
 """
+import asyncio
+import logging
+import sys
 import time
+import threading
 import requests
 from dataclasses import dataclass
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
+from ..utils.compat import DATACLASS_SLOTS
 from ..utils.config import config
+from ..utils.http import build_session
+from ..utils.serialization import loads
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+_BANNER = "=" * 60
+
+# The background refresher renews a token this many seconds before
+# get_token() would consider it expired; failed refreshes retry after
+# REFRESH_RETRY_SECONDS
+REFRESH_AHEAD_SECONDS = 30
+REFRESH_RETRY_SECONDS = 5
+
+# Upper bound for token_buffer_seconds; a buffer close to the token lifetime
+# would make every token look expired and force a refresh per call
+MAX_TOKEN_BUFFER_SECONDS = 300
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TokenResponse:
     """OAuth2 token response from HID Origo"""
     access_token: str
     token_type: str
     expires_in: int
     id_token: Optional[str] = None
-    obtained_at: float = 0
+    obtained_at: float = 0  # time.monotonic() when the token was issued
 
     def is_expired(self, buffer_seconds: int = 60) -> bool:
-        """Check if token is expired (with buffer for safety)"""
+        """
+        Check if token is expired (with buffer for safety)
+
+        Uses the monotonic clock so NTP adjustments to the wall clock cannot
+        make an expired token look valid. The buffer covers request latency
+        so a token is never sent when it would expire in flight.
+        """
         if not self.obtained_at:
             return True
-        elapsed = time.time() - self.obtained_at
+        elapsed = time.monotonic() - self.obtained_at
         return elapsed >= (self.expires_in - buffer_seconds)
 
 
@@ -41,9 +69,12 @@ class OrigoAuth:
     HID Origo Authentication Client
 
     Usage:
-        auth = OrigoAuth()
-        auth.authenticate()
-        headers = auth.get_headers()
+        with OrigoAuth() as auth:
+            auth.authenticate()
+            headers = auth.get_headers()
+
+    The underlying HTTP session is shared with the API clients built
+    from this object, so connections to Origo are reused across calls.
     """
 
     def __init__(
@@ -51,18 +82,51 @@ class OrigoAuth:
         organization_id: str = None,
         client_id: str = None,
         client_secret: str = None,
-        base_url: str = None
+        base_url: str = None,
+        token_buffer_seconds: int = None,
+        app_id: str = "acme-mobile-access",
+        app_version: str = "1.0.0"
     ):
         self.organization_id = organization_id or config.organization_id
         self.client_id = client_id or config.client_id
         self.client_secret = client_secret or config.client_secret
         self.base_url = base_url or config.base_url
+        # OAuth2 token endpoint URL (fixed for the lifetime of the client)
+        self.token_endpoint = f"{self.base_url}/authentication/customer/{self.organization_id}/token"
+        token_buffer_seconds = (
+            config.token_buffer_seconds if token_buffer_seconds is None else token_buffer_seconds
+        )
+        self.token_buffer_seconds = min(max(token_buffer_seconds, 0), MAX_TOKEN_BUFFER_SECONDS)
         self._token: Optional[TokenResponse] = None
+        self._token_lock = threading.RLock()
+        self.app_id = app_id
+        self.app_version = app_version
+        # Headers that never change for this client; Authorization is filled per token
+        self._header_template = {
+            "Authorization": None,
+            "Application-ID": app_id,
+            "Application-Version": app_version,
+            "Content-Type": "application/json"
+        }
+        self._headers_cache: Optional[tuple] = None
+        self._refresher: Optional[asyncio.Task] = None
+        self._session = build_session()
 
     @property
-    def token_endpoint(self) -> str:
-        """Construct the OAuth2 token endpoint URL"""
-        return f"{self.base_url}/authentication/customer/{self.organization_id}/token"
+    def session(self) -> requests.Session:
+        """Pooled HTTP session shared by all API clients using this auth"""
+        return self._session
+
+    def close(self):
+        """Stop the background refresher and release pooled connections"""
+        self.stop_refresher()
+        self._session.close()
+
+    def __enter__(self) -> "OrigoAuth":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def authenticate(self) -> TokenResponse:
         """
@@ -79,10 +143,14 @@ class OrigoAuth:
         Returns:
             TokenResponse with access_token, token_type, expires_in
         """
-        print(f"\n{'='*60}")
-        print("STEP 1: OAuth2 Authentication")
-        print(f"{'='*60}")
-        print(f"Endpoint: POST {self.token_endpoint}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "\n%s\nSTEP 1: OAuth2 Authentication\n%s\nEndpoint: POST %s\n"
+                "\nRequest Body (form-urlencoded):\n  client_id: %s"
+                "\n  client_secret: ********\n  grant_type: client_credentials",
+                _BANNER, _BANNER, self.token_endpoint,
+                f"{self.client_id[:10]}..." if self.client_id else "NOT SET"
+            )
 
         # Request body - form-urlencoded (NOT JSON!)
         payload = {
@@ -91,51 +159,114 @@ class OrigoAuth:
             "grant_type": "client_credentials"
         }
 
-        print(f"\nRequest Body (form-urlencoded):")
-        print(f"  client_id: {self.client_id[:10]}..." if self.client_id else "  client_id: NOT SET")
-        print(f"  client_secret: ********")
-        print(f"  grant_type: client_credentials")
-
         headers = {
             "Content-Type": "application/x-www-form-urlencoded"
         }
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.token_endpoint,
                 data=payload,
                 headers=headers,
                 timeout=30
             )
             response.raise_for_status()
-            data = response.json()
+            data = loads(response.content)
 
             self._token = TokenResponse(
                 access_token=data["access_token"],
                 token_type=data.get("token_type", "Bearer"),
                 expires_in=data.get("expires_in", 3600),
                 id_token=data.get("id_token"),
-                obtained_at=time.time()
+                obtained_at=time.monotonic()
             )
 
-            print(f"\n✓ Authentication Successful!")
-            print(f"  Token Type: {self._token.token_type}")
-            print(f"  Expires In: {self._token.expires_in} seconds")
-            print(f"  Access Token: {self._token.access_token[:20]}...")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "\n✓ Authentication Successful!\n  Token Type: %s"
+                    "\n  Expires In: %s seconds\n  Access Token: %s...",
+                    self._token.token_type, self._token.expires_in,
+                    self._token.access_token[:20]
+                )
 
             return self._token
 
         except requests.exceptions.RequestException as e:
-            print(f"\n✗ Authentication Failed: {e}")
+            logger.error("\n✗ Authentication Failed: %s", e)
             raise
 
-    def get_token(self) -> str:
-        """Get current access token, refreshing if expired"""
-        if not self._token or self._token.is_expired():
+    def start_refresher(self) -> asyncio.Task:
+        """
+        Keep the token fresh from a background task on the running event loop
+
+        The token is renewed REFRESH_AHEAD_SECONDS before it would expire,
+        so get_token() keeps returning a valid token without refreshing on
+        the request path. get_token() still refreshes on demand if the task
+        falls behind. Tokens too short-lived for those margins are renewed
+        halfway through their lifetime, and consecutive refreshes are at
+        least REFRESH_RETRY_SECONDS apart. Stopped by stop_refresher() or
+        close().
+        """
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(self._refresh_loop())
+        return self._refresher
+
+    def stop_refresher(self):
+        """Cancel the background refresher, if running"""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            self._refresher = None
+
+    async def _refresh_loop(self):
+        while True:
+            token = self._token
+            if token and token.obtained_at:
+                elapsed = time.monotonic() - token.obtained_at
+                lifetime = token.expires_in - self.token_buffer_seconds - REFRESH_AHEAD_SECONDS
+                if lifetime <= 0:
+                    # Token too short-lived for the margins; renew halfway through
+                    lifetime = token.expires_in / 2
+                # Never spin: even an overdue refresh waits a little
+                await asyncio.sleep(max(lifetime - elapsed, REFRESH_RETRY_SECONDS))
+            try:
+                # Blocking HTTP call; serialized with on-demand refreshes
+                await asyncio.to_thread(self._refresh)
+            except Exception as e:
+                logger.warning("Background token refresh failed: %s", e)
+                await asyncio.sleep(REFRESH_RETRY_SECONDS)
+
+    def _refresh(self):
+        with self._token_lock:
             self.authenticate()
-        return self._token.access_token
 
-    def get_headers(self, app_id: str = "acme-mobile-access", app_version: str = "1.0.0") -> dict:
+    def has_valid_token(self) -> bool:
+        """True if get_token() would return without a refresh request"""
+        token = self._token
+        return bool(token) and not token.is_expired(self.token_buffer_seconds)
+
+    def get_token(self) -> str:
+        """
+        Get current access token, refreshing if expired
+
+        Valid tokens are returned without locking. Refreshes are serialized
+        so concurrent callers trigger a single token request, not one each.
+        """
+        token = self._token
+        if token and not token.is_expired(self.token_buffer_seconds):
+            return token.access_token
+
+        with self._token_lock:
+            # Another thread may have refreshed while we waited for the lock
+            if not self._token or self._token.is_expired(self.token_buffer_seconds):
+                self.authenticate()
+            return self._token.access_token
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Default request headers for the current token (read-only)"""
+        return self.get_headers()
+
+    def get_headers(self, app_id: str = None, app_version: str = None) -> Mapping[str, str]:
         """
         Get headers required for all HID Origo API calls
 
@@ -143,12 +274,27 @@ class OrigoAuth:
         - Authorization: Bearer {access_token}
         - Application-ID: Identifies your application
         - Application-Version: Your app version
+
+        app_id/app_version default to the values given at construction.
+        With the defaults, the same read-only mapping is returned until
+        the token rotates; copy it with dict() to add headers.
         """
+        access_token = self.get_token()
+        if app_id is None and app_version is None:
+            cached = self._headers_cache
+            if cached and cached[0] is access_token:
+                return cached[1]
+            headers = MappingProxyType(
+                {**self._header_template, "Authorization": f"Bearer {access_token}"}
+            )
+            self._headers_cache = (access_token, headers)
+            return headers
+
         return {
-            "Authorization": f"Bearer {self.get_token()}",
-            "Application-ID": app_id,
-            "Application-Version": app_version,
-            "Content-Type": "application/json"
+            **self._header_template,
+            "Authorization": f"Bearer {access_token}",
+            "Application-ID": app_id or self.app_id,
+            "Application-Version": app_version or self.app_version
         }
 
 
@@ -163,20 +309,22 @@ class MockOrigoAuth(OrigoAuth):
     Use this when you don't have actual HID Origo credentials.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._mock_latency = config.mock_latency_ms / 1000
+
     def authenticate(self) -> TokenResponse:
         """Simulate successful authentication"""
-        print(f"\n{'='*60}")
-        print("STEP 1: OAuth2 Authentication (SIMULATED)")
-        print(f"{'='*60}")
-        print(f"Endpoint: POST {self.token_endpoint}")
-
-        print(f"\nRequest Body (form-urlencoded):")
-        print(f"  client_id: demo-client-id")
-        print(f"  client_secret: ********")
-        print(f"  grant_type: client_credentials")
+        logger.debug(
+            "\n%s\nSTEP 1: OAuth2 Authentication (SIMULATED)\n%s\nEndpoint: POST %s\n"
+            "\nRequest Body (form-urlencoded):\n  client_id: demo-client-id"
+            "\n  client_secret: ********\n  grant_type: client_credentials",
+            _BANNER, _BANNER, self.token_endpoint
+        )
 
         # Simulate network delay
-        time.sleep(0.5)
+        if self._mock_latency:
+            time.sleep(self._mock_latency)
 
         # Create mock token
         self._token = TokenResponse(
@@ -184,18 +332,23 @@ class MockOrigoAuth(OrigoAuth):
             token_type="Bearer",
             expires_in=3600,
             id_token="mock_id_token_" + "y" * 40,
-            obtained_at=time.time()
+            obtained_at=time.monotonic()
         )
 
-        print(f"\n✓ Authentication Successful! (SIMULATED)")
-        print(f"  Token Type: {self._token.token_type}")
-        print(f"  Expires In: {self._token.expires_in} seconds")
-        print(f"  Access Token: {self._token.access_token[:30]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "\n✓ Authentication Successful! (SIMULATED)\n  Token Type: %s"
+                "\n  Expires In: %s seconds\n  Access Token: %s...",
+                self._token.token_type, self._token.expires_in,
+                self._token.access_token[:30]
+            )
 
         return self._token
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
+
     # Demo the authentication flow
     print("\n" + "="*70)
     print("HID ORIGO AUTHENTICATION DEMO")
@@ -0,0 +1,164 @@
+"""
+Shared plumbing for the HID Origo API clients
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Iterable, List, Optional
+
+import httpx
+import requests
+
+from ..utils.config import config
+from ..utils.http import ASYNC_MAX_CONNECTIONS, build_async_client, with_idempotency_key
+from ..utils.serialization import dumps, loads
+from .auth import OrigoAuth
+
+logger = logging.getLogger(__name__)
+
+
+def _encode(body: Any) -> Optional[bytes]:
+    """Request body as bytes; pre-encoded bodies pass through"""
+    if body is None or isinstance(body, bytes):
+        return body
+    return dumps(body)
+
+
+async def gather_bounded(func: Callable[[Any], Awaitable], items: Iterable, limit: int) -> List[Any]:
+    """
+    Await func(item) for every item, at most `limit` at a time
+
+    Results are in input order; the first failure is raised. Bounding
+    the fan-out keeps large batches from queueing on the connection
+    pool until they hit its timeout.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def call(item):
+        async with semaphore:
+            return await func(item)
+
+    return list(await asyncio.gather(*(call(item) for item in items)))
+
+
+class APIClient:
+    """
+    Base class for the requests-based API clients
+
+    Subclasses set `path` (e.g. "/pass") and send requests through
+    _request(), which applies the auth headers, timeout and Idempotency-Key
+    policy, raises on HTTP errors and decodes the JSON response.
+    """
+
+    path = ""
+    timeout = 30
+
+    def __init__(self, auth: OrigoAuth, base_url: str = None, session: requests.Session = None):
+        self.auth = auth
+        self.base_url = base_url.rstrip("/") if base_url else config.base_url_normalized
+        self.endpoint = f"{self.base_url}{self.path}"
+        # Defaults to the auth client's pooled session, shared by all API clients
+        self.session = session or auth.session
+
+    def _request(self, method: str, url: str, body: Any = None, action: str = None, **kwargs) -> Any:
+        """
+        Send one API request and return the decoded JSON body (None if empty)
+
+        body may be a JSON-serializable object or pre-encoded bytes. When
+        `action` is given, a failure is logged as "<action> Failed" before
+        the RequestException is re-raised.
+        """
+        headers = self.auth.get_headers()
+        if method == "POST":
+            headers = with_idempotency_key(headers)
+        try:
+            response = self.session.request(
+                method, url, data=_encode(body), headers=headers, timeout=self.timeout, **kwargs
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            if action:
+                logger.error("\n✗ %s Failed: %s", action, e)
+            raise
+        return loads(response.content) if response.content else None
+
+
+class AsyncAPIClient:
+    """
+    Base class for the httpx-based async API clients
+
+    Subclasses set `path` (e.g. "/pass"). The HTTP/2 client is created on
+    first use and released by aclose() or an async with block.
+
+    To multiplex several API clients over one connection, pass the same
+    httpx.AsyncClient to each; a client passed in is never closed here,
+    so its owner closes it when done:
+
+        async with build_async_client() as http:
+            users_api = AsyncUserManagementAPI(auth, client=http)
+            creds_api = AsyncCredentialManagementAPI(auth, client=http)
+
+    Synchronous callers can use run_sync(), which runs one coroutine on a
+    private event loop and closes the client afterwards:
+
+        api.run_sync(api.bulk_suspend(pass_ids))
+    """
+
+    path = ""
+    # Requests in flight at once per bulk operation (see _gather_bounded)
+    max_concurrency = ASYNC_MAX_CONNECTIONS
+
+    def __init__(self, auth: OrigoAuth, base_url: str = None, client: httpx.AsyncClient = None):
+        self.auth = auth
+        self.base_url = base_url.rstrip("/") if base_url else config.base_url_normalized
+        self.endpoint = f"{self.base_url}{self.path}"
+        self._client: Optional[httpx.AsyncClient] = client
+        self._owns_client = client is None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP/2 client, created on first use"""
+        if self._client is None:
+            self._client = build_async_client()
+        return self._client
+
+    async def _headers(self):
+        """Auth headers; a token refresh (blocking HTTP) runs off the event loop"""
+        if self.auth.has_valid_token():
+            return self.auth.get_headers()
+        return await asyncio.to_thread(self.auth.get_headers)
+
+    async def _gather_bounded(self, func: Callable[[Any], Awaitable], items: Iterable) -> List[Any]:
+        """gather_bounded() limited to this client's max_concurrency"""
+        return await gather_bounded(func, items, self.max_concurrency)
+
+    async def _request(self, method: str, url: str, body: Any = None) -> Any:
+        """Async counterpart of APIClient._request"""
+        headers = await self._headers()
+        if method == "POST":
+            headers = with_idempotency_key(headers)
+        response = await self.client.request(method, url, content=_encode(body), headers=headers)
+        response.raise_for_status()
+        return loads(response.content) if response.content else None
+
+    async def aclose(self):
+        """Release pooled connections (unless the client was passed in)"""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def run_sync(self, coro):
+        """Run a coroutine from synchronous code and return its result"""
+        async def run():
+            try:
+                return await coro
+            finally:
+                # The client is bound to this loop, which ends here
+                await self.aclose()
+
+        return asyncio.run(run())
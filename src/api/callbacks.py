@@ -15,20 +15,74 @@ Key Concepts:
 - Webhook authentication via httpHeader + secret
 - Failed callbacks are stored and recoverable
 """
-import uuid
+import asyncio
+import inspect
+import logging
+import re
+import sys
+import threading
 import time
+import httpx
 import requests
+from collections import deque
+from contextlib import contextmanager
+from secrets import token_hex
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterator, Tuple
 from datetime import datetime
 from enum import Enum
+from importlib import resources
 
+from ..utils.cache import TTLCache
+from ..utils.compat import DATACLASS_SLOTS
 from ..utils.config import config
+from ..utils.serialization import dumps, loads
 from .auth import OrigoAuth, MockOrigoAuth
+from .base import APIClient, AsyncAPIClient
 
+logger = logging.getLogger(__name__)
 
-class EventType(Enum):
-    """HID Origo Event Types"""
+_BANNER = "=" * 60
+
+# Fastest available ISO 8601 parser for CloudEvent timestamps
+try:
+    from ciso8601 import parse_datetime as _parse_dt
+except ImportError:
+    if sys.version_info >= (3, 11):
+        # fromisoformat accepts a trailing "Z" natively from 3.11
+        _parse_dt = datetime.fromisoformat
+    else:
+        def _parse_dt(value: str) -> datetime:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+# Webhook endpoints must be HTTPS URLs
+_URL_RE = re.compile(r"^https://[A-Za-z0-9.\-]+(?::\d+)?(/.*)?$")
+
+# Default bound on events waiting for an EventDispatcher worker
+EVENT_QUEUE_SIZE = 10_000
+
+# Redelivered events are recognized by (id, subject) for this many seconds;
+# at most SEEN_EVENTS_SIZE keys are remembered
+DEDUPE_TTL = 24 * 3600
+SEEN_EVENTS_SIZE = 100_000
+
+# EndpointHealth defaults: the circuit opens when more than CIRCUIT_FAILURE_RATIO
+# of the last CIRCUIT_WINDOW calls failed, and admits a probe call after
+# CIRCUIT_RESET_SECONDS
+CIRCUIT_WINDOW = 20
+CIRCUIT_FAILURE_RATIO = 0.5
+CIRCUIT_RESET_SECONDS = 30
+# Weight of the newest sample in EndpointHealth.latency
+_LATENCY_ALPHA = 0.2
+
+
+class EventType(str, Enum):
+    """
+    HID Origo Event Types
+
+    Members are strings, so they compare and hash equal to the raw
+    "type" values found in event payloads.
+    """
     # User events
     USER_CREATED = "USER_CREATED"
     USER_UPDATED = "USER_UPDATED"
@@ -45,7 +99,31 @@ class EventType(Enum):
     CREDENTIAL_RESUMED = "CREDENTIAL_RESUMED"
 
 
-@dataclass
+# Raw type string -> the one shared str object for that known type. Parsed
+# events and filters store the shared object, so the type lookups below (all
+# keyed by EventType values) hit on identity before comparing characters.
+_CANONICAL_TYPES = {event_type.value: event_type.value for event_type in EventType}
+
+
+def _canonical_type(value: str) -> str:
+    return _CANONICAL_TYPES.get(value, value)
+
+
+USER_EVENT_TYPES = frozenset({
+    EventType.USER_CREATED.value,
+    EventType.USER_UPDATED.value,
+    EventType.USER_DELETED.value,
+})
+
+PASS_EVENT_TYPES = frozenset({
+    EventType.PASS_CREATED.value,
+    EventType.PASS_UPDATED.value,
+    EventType.PASS_DELETED.value,
+    EventType.PASS_PROVISIONED.value,
+})
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class EventFilter:
     """
     Event Filter for callback registration
@@ -57,13 +135,28 @@ class EventFilter:
     - Filters specify which event types to receive
     - Can filter by event type groups (e.g., all USER_* events)
     - Reduces noise and processing overhead
+
+    Filters are immutable, so the predefined ones are shared instances.
     """
-    event_types: List[str] = field(default_factory=list)
+    event_types: Tuple[str, ...] = ()
     id: Optional[str] = None
 
+    # Set view of event_types for matches()
+    _types_set: frozenset = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "event_types", tuple(_canonical_type(t) for t in self.event_types)
+        )
+        object.__setattr__(self, "_types_set", frozenset(self.event_types))
+
+    def matches(self, event_type: str) -> bool:
+        """True if events of this type pass the filter (an empty filter passes all)"""
+        return not self._types_set or event_type in self._types_set
+
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "eventTypes": self.event_types
+            "eventTypes": list(self.event_types)
         }
 
     @classmethod
@@ -71,29 +164,36 @@ class EventFilter:
         """
         Question 3 Answer: Filter for only user management events
         """
-        return cls(event_types=[
-            "USER_CREATED",
-            "USER_UPDATED",
-            "USER_DELETED"
-        ])
+        return USER_EVENTS_FILTER
 
     @classmethod
     def pass_events_only(cls) -> "EventFilter":
         """Filter for only pass/credential events"""
-        return cls(event_types=[
-            "PASS_CREATED",
-            "PASS_UPDATED",
-            "PASS_DELETED",
-            "PASS_PROVISIONED"
-        ])
+        return PASS_EVENTS_FILTER
 
     @classmethod
     def all_events(cls) -> "EventFilter":
         """No filter - receive all events"""
-        return cls(event_types=[])
+        return ALL_EVENTS_FILTER
+
+
+USER_EVENTS_FILTER = EventFilter(event_types=(
+    EventType.USER_CREATED.value,
+    EventType.USER_UPDATED.value,
+    EventType.USER_DELETED.value
+))
 
+PASS_EVENTS_FILTER = EventFilter(event_types=(
+    EventType.PASS_CREATED.value,
+    EventType.PASS_UPDATED.value,
+    EventType.PASS_DELETED.value,
+    EventType.PASS_PROVISIONED.value
+))
 
-@dataclass
+ALL_EVENTS_FILTER = EventFilter()
+
+
+@dataclass(**DATACLASS_SLOTS)
 class CallbackRegistration:
     """
     Callback (Webhook) Registration
@@ -105,7 +205,7 @@ class CallbackRegistration:
     - Enables real-time synchronization of credential lifecycle
     """
     url: str
-    filter: EventFilter = field(default_factory=EventFilter)
+    filter: EventFilter = ALL_EVENTS_FILTER
 
     # Authentication (both required if either is set)
     http_header: Optional[str] = None  # e.g., "Authorization"
@@ -115,8 +215,13 @@ class CallbackRegistration:
     id: Optional[str] = None
     created: Optional[datetime] = None
 
+    _payload_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API request format"""
+        if not _URL_RE.match(self.url):
+            raise ValueError(f"Callback URL must be an https:// URL: {self.url}")
+
         data = {
             "url": self.url,
             "filter": self.filter.to_dict()
@@ -129,8 +234,22 @@ class CallbackRegistration:
 
         return data
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialized request body, cached until a request field changes
+
+        Lets one registration be posted to several environments without
+        re-encoding it for each call.
+        """
+        key = (self.url, self.filter, self.http_header, self.secret)
+        cached = self._payload_cache
+        if cached is None or cached[0] != key:
+            cached = (key, dumps(self.to_dict()))
+            self._payload_cache = cached
+        return cached[1]
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class CloudEvent:
     """
     CloudEvents specification payload
@@ -140,12 +259,17 @@ class CloudEvent:
     HID Origo sends events in CloudEvents format:
     - type: Event type (e.g., "PASS_UPDATED")
     - subject: Resource identifier (e.g., "pass/45d3d21e-xxxx")
-    - time: ISO 8601 timestamp
+    - time: ISO 8601 timestamp (optional; None when absent)
     - data: Event-specific payload
+
+    Events are immutable and reference the parsed payload's values
+    (including the data dict) rather than copying them, so they can be
+    handed to concurrent handlers without defensive copies. Treat data
+    as read-only.
     """
     type: str
     subject: str
-    time: datetime
+    time: Optional[datetime]
     data: Dict[str, Any]
 
     # CloudEvents metadata
@@ -155,17 +279,63 @@ class CloudEvent:
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "CloudEvent":
-        """Parse CloudEvent from webhook payload"""
+        """
+        Parse CloudEvent from webhook payload
+
+        Raises ValueError if "time" is present but not ISO 8601. A missing
+        or null "data" becomes an empty dict; other values are kept as sent.
+        """
+        timestamp = payload.get("time")
+        data = payload.get("data")
         return cls(
             id=payload.get("id"),
-            type=payload.get("type", ""),
+            type=_canonical_type(payload.get("type", "")),
             subject=payload.get("subject", ""),
-            time=datetime.fromisoformat(payload.get("time", "").replace("Z", "+00:00")),
-            data=payload.get("data", {}),
+            time=_parse_dt(timestamp) if timestamp else None,
+            data={} if data is None else data,
             source=payload.get("source"),
             specversion=payload.get("specversion", "1.0")
         )
 
+    @classmethod
+    def from_batch(cls, payloads: List[Dict[str, Any]]) -> List["CloudEvent"]:
+        """
+        Parse a CloudEvents batch (application/cloudevents-batch+json)
+
+        Equivalent to calling from_dict on each payload, with the lookups
+        bound once for the whole batch. Malformed items are logged and
+        skipped rather than failing the batch, since Origo redelivers a
+        whole batch that is not acknowledged.
+        """
+        _cls, _parse, _type = cls, _parse_dt, _canonical_type
+        events = []
+        append = events.append
+        for p in payloads:
+            try:
+                append(_cls(
+                    id=p.get("id"),
+                    type=_type(p.get("type", "")),
+                    subject=p.get("subject", ""),
+                    time=_parse(t) if (t := p.get("time")) else None,
+                    data={} if (d := p.get("data")) is None else d,
+                    source=p.get("source"),
+                    specversion=p.get("specversion", "1.0")
+                ))
+            except (AttributeError, TypeError, ValueError) as e:
+                event_id = p.get("id") if isinstance(p, dict) else None
+                logger.warning("Skipping malformed event %s: %s", event_id, e)
+        return events
+
+    @property
+    def is_user_event(self) -> bool:
+        """True for USER_* events"""
+        return self.type in USER_EVENT_TYPES
+
+    @property
+    def is_pass_event(self) -> bool:
+        """True for PASS_* events"""
+        return self.type in PASS_EVENT_TYPES
+
     def interpret(self) -> str:
         """
         Question 5 Answer: Interpret what this event means
@@ -182,15 +352,8 @@ class CloudEvent:
             }
         }
         """
-        interpretations = {
-            "PASS_UPDATED": self._interpret_pass_updated,
-            "PASS_CREATED": self._interpret_pass_created,
-            "USER_CREATED": self._interpret_user_created,
-            "USER_DELETED": self._interpret_user_deleted,
-        }
-
-        interpreter = interpretations.get(self.type, self._interpret_generic)
-        return interpreter()
+        interpreter = CloudEvent._INTERPRETERS.get(self.type, CloudEvent._interpret_generic)
+        return interpreter(self)
 
     def _interpret_pass_updated(self) -> str:
         status = self.data.get("status", "UNKNOWN")
@@ -232,8 +395,153 @@ class CloudEvent:
     def _interpret_generic(self) -> str:
         return f"Event {self.type} received for {self.subject}"
 
+    # Event type -> interpreter, built once rather than per interpret() call
+    _INTERPRETERS = {
+        EventType.PASS_UPDATED.value: _interpret_pass_updated,
+        EventType.PASS_CREATED.value: _interpret_pass_created,
+        EventType.USER_CREATED.value: _interpret_user_created,
+        EventType.USER_DELETED.value: _interpret_user_deleted,
+    }
+
+
+class EventDispatcher:
+    """
+    Bounded queue of CloudEvent payloads drained by a fixed pool of workers
+
+    Receiving an event only enqueues it, so a burst of deliveries cannot
+    start unbounded concurrent processing: at most `workers` events are
+    handled at once and at most `maxsize` wait. submit() waits for room;
+    submit_nowait() drops the event (and returns False) when full.
+
+    `handler` is called with each parsed CloudEvent and may be a plain
+    function or a coroutine function. By default the event's interpretation
+    is logged.
+
+    Origo may deliver an event more than once. A payload whose (id, subject)
+    was submitted within `dedupe_ttl` seconds is not queued again, and
+    both submit methods return False for it. If handling an event fails,
+    it is forgotten so a redelivery is processed.
+
+    Usage:
+        async with EventDispatcher(handler, workers=8) as dispatcher:
+            await dispatcher.submit(payload)
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[CloudEvent], Any] = None,
+        workers: int = 8,
+        maxsize: int = EVENT_QUEUE_SIZE,
+        dedupe_ttl: float = DEDUPE_TTL
+    ):
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1: {workers}")
+        self.handler = handler or self._log_interpretation
+        self.workers = workers
+        self.maxsize = maxsize
+        self._seen = TTLCache(maxsize=SEEN_EVENTS_SIZE, ttl=dedupe_ttl)
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @staticmethod
+    def _log_interpretation(event: CloudEvent):
+        logger.info("Event %s:\n%s", event.type, event.interpret())
+
+    async def start(self):
+        """Create the queue and worker tasks on the running event loop"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    @staticmethod
+    def _dedupe_key(payload: Dict[str, Any]) -> Optional[tuple]:
+        event_id = payload.get("id")
+        return None if event_id is None else (event_id, payload.get("subject"))
+
+    def _is_duplicate(self, key: Optional[tuple]) -> bool:
+        if key is None:
+            return False
+        if key in self._seen:
+            logger.debug("Event %s already processed; skipped", key[0])
+            return True
+        return False
+
+    async def submit(self, payload: Dict[str, Any]) -> bool:
+        """
+        Queue one event payload, waiting while the queue is full
+
+        Returns False if the event was a duplicate and not queued.
+        """
+        key = self._dedupe_key(payload)
+        if self._is_duplicate(key):
+            return False
+        # Claim the key before waiting for room, so a concurrent redelivery
+        # is seen as a duplicate; release it if the event never gets queued
+        if key is not None:
+            self._seen.set(key, True)
+        try:
+            await self._queue.put(payload)
+        except BaseException:
+            if key is not None:
+                self._seen.pop(key)
+            raise
+        return True
 
-class CallbackAPI:
+    def submit_nowait(self, payload: Dict[str, Any]) -> bool:
+        """Queue one event payload; returns False if it is a duplicate or the queue is full"""
+        key = self._dedupe_key(payload)
+        if self._is_duplicate(key):
+            return False
+        try:
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning("Event queue full (%d); dropped %s", self.maxsize, payload.get("id"))
+            return False
+        if key is not None:
+            self._seen.set(key, True)
+        return True
+
+    async def join(self):
+        """Wait until every queued event has been handled"""
+        await self._queue.join()
+
+    async def aclose(self):
+        """Finish the queued events, then stop the workers"""
+        if self._queue is None:
+            return
+        await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._queue = None
+        self._tasks = []
+
+    async def __aenter__(self) -> "EventDispatcher":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _worker(self):
+        queue = self._queue
+        while True:
+            payload = await queue.get()
+            try:
+                event = CloudEvent.from_dict(payload)
+                result = self.handler(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception("Failed to handle event %s", payload.get("id"))
+                key = self._dedupe_key(payload)
+                if key is not None:
+                    self._seen.pop(key)
+            finally:
+                queue.task_done()
+
+
+class CallbackAPI(APIClient):
     """
     HID Origo Callback/Events API Client
 
@@ -245,13 +553,16 @@ class CallbackAPI:
     - Q5: Event payload interpretation
     """
 
-    def __init__(self, auth: OrigoAuth, base_url: str = None):
-        self.auth = auth
-        self.base_url = (base_url or config.base_url).rstrip("/")
+    path = "/callback"
 
-    @property
-    def endpoint(self) -> str:
-        return f"{self.base_url}/callback"
+    def __init__(self, auth: OrigoAuth, base_url: str = None, session: requests.Session = None):
+        super().__init__(auth, base_url, session)
+
+        # list_callbacks cache: (registrations, etag, fetched_at monotonic)
+        self._list_cache: Optional[tuple] = None
+        # Registrations fail fast with CircuitOpenError while the
+        # registration endpoint keeps failing
+        self.health = EndpointHealth(self.endpoint)
 
     def register_callback(self, registration: CallbackRegistration) -> CallbackRegistration:
         """
@@ -273,60 +584,116 @@ class CallbackAPI:
         Optional parameters:
         - httpHeader: Header name for authentication (e.g., "Authorization")
         - secret: Header value (e.g., "Bearer token123" or "Basic base64...")
-        """
-        print(f"\n{'='*60}")
-        print("CALLBACK REGISTRATION")
-        print(f"{'='*60}")
-        print(f"Endpoint: POST {self.endpoint}")
-
-        payload = registration.to_dict()
-        print(f"\nRequest Body:")
-        print(f"  url: {registration.url}")
-        print(f"  filter.eventTypes: {registration.filter.event_types or 'ALL'}")
-        if registration.http_header:
-            print(f"  httpHeader: {registration.http_header}")
-            print(f"  secret: ******** (hidden)")
 
-        try:
-            response = requests.post(
-                self.endpoint,
-                json=payload,
-                headers=self.auth.get_headers(),
-                timeout=30
+        Raises CircuitOpenError without sending anything while `health`
+        has the registration endpoint's circuit open. Only connection
+        errors, timeouts, 429 and 5xx responses count against the circuit;
+        a rejected registration (4xx) does not.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "\n%s\nCALLBACK REGISTRATION\n%s\nEndpoint: POST %s\n"
+                "\nRequest Body:\n  url: %s\n  filter.eventTypes: %s%s",
+                _BANNER, _BANNER, self.endpoint,
+                registration.url, list(registration.filter.event_types) or "ALL",
+                f"\n  httpHeader: {registration.http_header}\n  secret: ******** (hidden)"
+                if registration.http_header else ""
             )
-            response.raise_for_status()
-            data = response.json()
 
-            registration.id = data.get("id")
-            print(f"\n✓ Callback Registered!")
-            print(f"  Registration ID: {registration.id}")
+        # Built first: an invalid registration must not count against the endpoint
+        body = registration.to_json_bytes()
+        with self.health.track():
+            data = self._request("POST", self.endpoint, body, action="Callback Registration")
 
-            return registration
+        registration.id = data.get("id")
+        self._list_cache = None
+        logger.info("\n✓ Callback Registered!\n  Registration ID: %s", registration.id)
 
-        except requests.exceptions.RequestException as e:
-            print(f"\n✗ Callback Registration Failed: {e}")
-            raise
+        return registration
 
-    def list_callbacks(self) -> List[CallbackRegistration]:
-        """List all registered callbacks"""
-        response = requests.get(
+    def list_callbacks(self, ttl: float = 30.0) -> List[CallbackRegistration]:
+        """
+        List all registered callbacks
+
+        Results are reused for `ttl` seconds. After that the list is
+        revalidated with If-None-Match, and a 304 keeps the cached list
+        without re-downloading or re-parsing it. Registering or deleting a
+        callback through this client clears the cache.
+        """
+        cached = self._list_cache
+        if cached and time.monotonic() - cached[2] < ttl:
+            return cached[0]
+
+        headers = self.auth.get_headers()
+        if cached and cached[1]:
+            headers = {**headers, "If-None-Match": cached[1]}
+
+        response = self.session.get(
             self.endpoint,
-            headers=self.auth.get_headers(),
-            timeout=30
+            headers=headers,
+            timeout=self.timeout
         )
+        if cached and response.status_code == 304:
+            self._list_cache = (cached[0], cached[1], time.monotonic())
+            return cached[0]
+
         response.raise_for_status()
         # Note: httpHeader and secret are NOT returned for security
-        return response.json()
+        callbacks = loads(response.content)
+        self._list_cache = (callbacks, response.headers.get("ETag"), time.monotonic())
+        return callbacks
 
     def delete_callback(self, callback_id: str) -> bool:
         """Remove a callback registration"""
-        response = requests.delete(
-            f"{self.endpoint}/{callback_id}",
-            headers=self.auth.get_headers(),
-            timeout=30
-        )
-        response.raise_for_status()
-        print(f"✓ Callback {callback_id} deleted")
+        self._request("DELETE", f"{self.endpoint}/{callback_id}")
+        self._list_cache = None
+        logger.info("✓ Callback %s deleted", callback_id)
+        return True
+
+
+class AsyncCallbackAPI(AsyncAPIClient):
+    """
+    Asynchronous Callback API Client
+
+    Same operations as CallbackAPI over an HTTP/2 httpx.AsyncClient, for
+    bulk work such as registering one webhook per region. Concurrent
+    requests share a single multiplexed connection.
+
+    Usage:
+        async with AsyncCallbackAPI(auth) as callback_api:
+            registered = await callback_api.bulk_register(registrations)
+    """
+
+    path = "/callback"
+
+    def __init__(self, auth: OrigoAuth, base_url: str = None, client: httpx.AsyncClient = None):
+        super().__init__(auth, base_url, client)
+        # See CallbackAPI: fail fast while the registration endpoint is failing
+        self.health = EndpointHealth(self.endpoint)
+
+    async def register_callback(self, registration: CallbackRegistration) -> CallbackRegistration:
+        """Register a new callback (webhook) - see CallbackAPI.register_callback"""
+        body = registration.to_json_bytes()
+        with self.health.track():
+            data = await self._request("POST", self.endpoint, body)
+        registration.id = data.get("id")
+        logger.info("✓ Callback Registered: %s -> %s", registration.url, registration.id)
+        return registration
+
+    async def bulk_register(
+        self, registrations: List[CallbackRegistration]
+    ) -> List[CallbackRegistration]:
+        """Register several callbacks concurrently"""
+        return await self._gather_bounded(self.register_callback, registrations)
+
+    async def list_callbacks(self) -> List[CallbackRegistration]:
+        """List all registered callbacks"""
+        return await self._request("GET", self.endpoint)
+
+    async def delete_callback(self, callback_id: str) -> bool:
+        """Remove a callback registration"""
+        await self._request("DELETE", f"{self.endpoint}/{callback_id}")
+        logger.info("✓ Callback %s deleted", callback_id)
         return True
 
 
@@ -350,50 +717,144 @@ class CallbackRecovery:
 
     @staticmethod
     def explain_recovery() -> str:
-        return """
-        RECOVERING MISSED CALLBACKS
-        ===========================
-
-        Scenario: Webhook endpoint was down for several hours
-
-        Step 1: Check event delivery status
-        -----------------------------------
-        - HID Origo marks failed deliveries as "failed"
-        - Events are stored and recoverable via Event Management API
-
-        Step 2: Query missed events
-        ---------------------------
-        GET /events?status=failed&since=2025-11-10T00:00:00Z
-
-        This returns all events that failed delivery since the specified time.
-
-        Step 3: Replay events manually
-        ------------------------------
-        For each missed event:
-        1. Parse the event payload
-        2. Process it through your normal event handler
-        3. Mark as processed in your system
-
-        Step 4: Ensure endpoint is back online
-        --------------------------------------
-        - Fix the underlying issue (server, firewall, SSL, etc.)
-        - Verify endpoint responds with HTTP 200 OK
-        - Test with a manual webhook delivery
-
-        Step 5: Request replay from Origo
-        ---------------------------------
-        Some events may be automatically retried by Origo.
-        Contact HID support if automatic retries are not occurring.
-
-        BEST PRACTICES:
-        ===============
-        1. Implement health checks for your webhook endpoint
-        2. Use multiple endpoints for redundancy
-        3. Store events in your own queue for processing
-        4. Make event handlers idempotent (safe to process twice)
-        5. Set up monitoring/alerting for webhook failures
-        6. Log all incoming events before processing
-        """
+        # Long-form text lives in a resource file so it is only loaded on demand
+        return resources.files(__package__).joinpath("callback_recovery.txt").read_text()
+
+
+def is_endpoint_failure(exc: BaseException) -> bool:
+    """
+    True if exc means the endpoint is unhealthy, not that the request was bad
+
+    Connection errors, timeouts, 429 and 5xx responses (from requests or
+    httpx) and calls cancelled or interrupted mid-flight count as failures.
+    Other errors, such as a 4xx rejection, mean the endpoint answered.
+    """
+    if not isinstance(exc, Exception):
+        return True
+    if isinstance(exc, requests.HTTPError):
+        if exc.response is None:
+            return True
+        status = exc.response.status_code
+    elif isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+    else:
+        return isinstance(exc, (requests.RequestException, httpx.TransportError))
+    return status == 429 or status >= 500
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose circuit is open"""
+
+
+class CircuitState(str, Enum):
+    """EndpointHealth circuit states"""
+    CLOSED = "CLOSED"          # Calls go through
+    OPEN = "OPEN"              # Calls fail fast with CircuitOpenError
+    HALF_OPEN = "HALF_OPEN"    # One probe call decides whether to close
+
+
+class EndpointHealth:
+    """
+    Circuit breaker and latency tracker for one HTTP endpoint
+
+    CallbackAPI and AsyncCallbackAPI guard the registration endpoint with
+    one (their `health` attribute); it can equally wrap deliveries to a
+    webhook URL. A slow or failing endpoint should not tie up every worker
+    in timeouts and retries. Once more than `failure_ratio` of the last
+    `window` calls have failed, the circuit opens and calls fail fast with
+    CircuitOpenError, so the caller can defer or drop the work. After
+    `reset_after` seconds one probe call is let through; success closes
+    the circuit, failure keeps it open for another period.
+
+    Within track(), an exception is recorded as a failure only if
+    `is_failure(exc)` is true (is_endpoint_failure by default); otherwise
+    the call counts as a success for the circuit and the exception is
+    re-raised as usual.
+
+    Thread-safe. `latency` is an exponentially weighted moving average of
+    call durations in seconds (None until the first call).
+
+    Usage:
+        health = EndpointHealth(registration.url)
+        with health.track():    # raises CircuitOpenError while open
+            deliver(registration.url, event)
+    """
+
+    def __init__(
+        self,
+        url: str,
+        window: int = CIRCUIT_WINDOW,
+        failure_ratio: float = CIRCUIT_FAILURE_RATIO,
+        reset_after: float = CIRCUIT_RESET_SECONDS,
+        is_failure: Callable[[BaseException], bool] = is_endpoint_failure
+    ):
+        self.url = url
+        self.failure_ratio = failure_ratio
+        self.reset_after = reset_after
+        self.is_failure = is_failure
+        self.state = CircuitState.CLOSED
+        self.latency: Optional[float] = None
+        self._outcomes = deque(maxlen=window)   # True for each failed call
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def check(self):
+        """Raise CircuitOpenError unless a call may be made now"""
+        with self._lock:
+            if self.state is CircuitState.CLOSED:
+                return
+            if (self.state is CircuitState.OPEN
+                    and time.monotonic() - self._opened_at >= self.reset_after):
+                self.state = CircuitState.HALF_OPEN
+                return
+            raise CircuitOpenError(f"Circuit open for {self.url}")
+
+    def record_success(self, duration: float):
+        with self._lock:
+            self._observe(duration)
+            if self.state is CircuitState.HALF_OPEN:
+                logger.info("Circuit closed for %s", self.url)
+                self.state = CircuitState.CLOSED
+                self._outcomes.clear()
+            else:
+                self._outcomes.append(False)
+
+    def record_failure(self, duration: float = None):
+        with self._lock:
+            if duration is not None:
+                self._observe(duration)
+            outcomes = self._outcomes
+            if self.state is not CircuitState.HALF_OPEN:
+                outcomes.append(True)
+                if (len(outcomes) < outcomes.maxlen
+                        or sum(outcomes) <= self.failure_ratio * len(outcomes)):
+                    return
+            logger.warning("Circuit opened for %s", self.url)
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Check the circuit, then record the enclosed call's outcome and duration"""
+        self.check()
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            # Includes cancellation, so a cancelled probe cannot leave the
+            # circuit stuck half-open
+            if self.is_failure(e):
+                self.record_failure(time.monotonic() - started)
+            else:
+                self.record_success(time.monotonic() - started)
+            raise
+        self.record_success(time.monotonic() - started)
+
+    def _observe(self, duration: float):
+        latency = self.latency
+        self.latency = duration if latency is None else (
+            latency + _LATENCY_ALPHA * (duration - latency)
+        )
 
 
 # =============================================================================
@@ -404,201 +865,61 @@ class MockCallbackAPI(CallbackAPI):
     """Mock Callback API for testing"""
 
     def __init__(self, auth: MockOrigoAuth = None):
-        self.auth = auth or MockOrigoAuth()
-        self.base_url = "https://api.origo.hidglobal.com"
+        super().__init__(auth or MockOrigoAuth(), base_url="https://api.origo.hidglobal.com")
         self._registrations: Dict[str, CallbackRegistration] = {}
+        # Event type -> registrations whose filter lists it; registrations
+        # with an empty filter receive every type and are kept separately
+        self._by_event_type: Dict[str, List[CallbackRegistration]] = {}
+        self._all_events: List[CallbackRegistration] = []
+        self._mock_latency = config.mock_latency_ms / 1000
+
+    def registrations_for(self, event_type: str) -> List[CallbackRegistration]:
+        """Registrations an event of this type would be delivered to"""
+        return self._by_event_type.get(event_type, []) + self._all_events
 
     def register_callback(self, registration: CallbackRegistration) -> CallbackRegistration:
         """Simulate callback registration"""
-        print(f"\n{'='*60}")
-        print("CALLBACK REGISTRATION - SIMULATED")
-        print(f"{'='*60}")
-        print(f"Endpoint: POST {self.endpoint}")
-
-        print(f"\nRequest Body:")
-        print(f"  {{")
-        print(f'    "url": "{registration.url}",')
-        print(f'    "filter": {{')
-        print(f'      "eventTypes": {registration.filter.event_types or "[]"}')
-        print(f'    }}')
-        if registration.http_header:
-            print(f'    "httpHeader": "{registration.http_header}",')
-            print(f'    "secret": "********"')
-        print(f"  }}")
-
-        time.sleep(0.2)
-
-        registration.id = f"cb-{uuid.uuid4().hex[:12]}"
-        self._registrations[registration.id] = registration
-
-        print(f"\n✓ Callback Registered! (SIMULATED)")
-        print(f"  Registration ID: {registration.id}")
-        print(f"\nNote: Your webhook must:")
-        print(f"  - Accept HTTP POST requests")
-        print(f"  - Content-Type: application/cloudevents-batch+json")
-        print(f"  - Return HTTP 200 OK on success")
-
-        return registration
-
-
-# =============================================================================
-# Webhook Handler (Flask example)
-# =============================================================================
-
-FLASK_WEBHOOK_EXAMPLE = '''
-"""
-Example Flask webhook handler for HID Origo events
-
-Run with: flask run --port 5000
-"""
-from flask import Flask, request, jsonify
-import hmac
-import hashlib
-
-app = Flask(__name__)
-
-# Your callback secret (set during registration)
-WEBHOOK_SECRET = "your_webhook_secret"
-
-def verify_signature(payload: bytes, signature: str) -> bool:
-    """Verify webhook signature for security"""
-    expected = hmac.new(
-        WEBHOOK_SECRET.encode(),
-        payload,
-        hashlib.sha256
-    ).hexdigest()
-    return hmac.compare_digest(expected, signature)
-
-@app.route("/webhooks/origo", methods=["POST"])
-def handle_origo_webhook():
-    """
-    Webhook endpoint for HID Origo events
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "\n%s\nCALLBACK REGISTRATION - SIMULATED\n%s\nEndpoint: POST %s\n"
+                '\nRequest Body:\n  {\n    "url": "%s",\n    "filter": {\n'
+                '      "eventTypes": %s\n    }%s\n  }',
+                _BANNER, _BANNER, self.endpoint,
+                registration.url, list(registration.filter.event_types),
+                f',\n    "httpHeader": "{registration.http_header}",\n    "secret": "********"'
+                if registration.http_header else ""
+            )
 
-    Requirements:
-    - Accept POST requests
-    - Content-Type: application/cloudevents-batch+json
-    - Return HTTP 200 OK
-    """
-    # Verify authentication (if configured)
-    auth_header = request.headers.get("Authorization")
-    if auth_header != f"Bearer {WEBHOOK_SECRET}":
-        return jsonify({"error": "Unauthorized"}), 401
-
-    # Parse CloudEvents batch
-    events = request.get_json()
-
-    for event in events:
-        event_type = event.get("type")
-        subject = event.get("subject")
-        data = event.get("data", {})
-
-        print(f"Received event: {event_type}")
-        print(f"  Subject: {subject}")
-        print(f"  Data: {data}")
-
-        # Handle specific event types
-        if event_type == "PASS_UPDATED":
-            handle_pass_updated(event)
-        elif event_type == "USER_DELETED":
-            handle_user_deleted(event)
-        # ... handle other event types
-
-    # CRITICAL: Return 200 OK to acknowledge receipt
-    return jsonify({"status": "received"}), 200
-
-def handle_pass_updated(event: dict):
-    """Handle PASS_UPDATED event"""
-    status = event["data"].get("status")
-    user_id = event["data"].get("userId")
-
-    if status == "COMPLETED":
-        # Provisioning successful!
-        # Update your database
-        # Notify the user
-        # Sync with access control system
-        print(f"Pass provisioned for user {user_id}")
-
-def handle_user_deleted(event: dict):
-    """Handle USER_DELETED event"""
-    # Cleanup local records
-    # Revoke physical access
-    pass
-
-if __name__ == "__main__":
-    app.run(port=5000, debug=True)
-'''
-
-
-if __name__ == "__main__":
-    print("\n" + "="*70)
-    print("HID ORIGO CALLBACKS & EVENTS DEMO")
-    print("="*70)
-
-    # Mock auth
-    auth = MockOrigoAuth(
-        organization_id="demo-org-123",
-        client_id="demo-client-id",
-        client_secret="demo-secret"
-    )
-    auth.authenticate()
-
-    # Mock callback API
-    callback_api = MockCallbackAPI(auth)
-
-    # Question 2: Register a callback
-    print("\n" + "="*70)
-    print("QUESTION 2: Callback Registration Flow")
-    print("="*70)
-
-    registration = CallbackRegistration(
-        url="https://acme.com/webhooks/origo",
-        filter=EventFilter.user_events_only(),  # Question 3: Filter for user events
-        http_header="Authorization",
-        secret="Bearer my-secret-token"
-    )
-
-    callback_api.register_callback(registration)
-
-    # Question 3: Event filter example
-    print("\n" + "="*70)
-    print("QUESTION 3: Event Filtering")
-    print("="*70)
-    print("\nFilter for only user management events:")
-    user_filter = EventFilter.user_events_only()
-    print(f"  eventTypes: {user_filter.event_types}")
-
-    # Question 4: Recovery explanation
-    print("\n" + "="*70)
-    print("QUESTION 4: Troubleshooting Failed Callbacks")
-    print("="*70)
-    print(CallbackRecovery.explain_recovery())
-
-    # Question 5: Event interpretation
-    print("\n" + "="*70)
-    print("QUESTION 5: Event Payload Interpretation")
-    print("="*70)
-
-    example_event = {
-        "type": "PASS_UPDATED",
-        "subject": "pass/45d3d21e-xxxx",
-        "time": "2025-11-10T14:05:00Z",
-        "data": {
-            "status": "COMPLETED",
-            "userId": "b47d-56f8-8bcd",
-            "organizationId": "7521464"
-        }
-    }
+        if self._mock_latency:
+            time.sleep(self._mock_latency)
 
-    print("\nExample Event Payload:")
-    import json
-    print(json.dumps(example_event, indent=2))
+        registration.id = f"cb-{token_hex(6)}"
+        self._registrations[registration.id] = registration
+        if registration.filter.event_types:
+            for event_type in registration.filter._types_set:
+                self._by_event_type.setdefault(event_type, []).append(registration)
+        else:
+            self._all_events.append(registration)
+
+        logger.info(
+            "\n✓ Callback Registered! (SIMULATED)\n  Registration ID: %s\n"
+            "\nNote: Your webhook must:\n  - Accept HTTP POST requests"
+            "\n  - Content-Type: application/cloudevents-batch+json"
+            "\n  - Return HTTP 200 OK on success",
+            registration.id
+        )
 
-    event = CloudEvent.from_dict(example_event)
-    print("\nInterpretation:")
-    print(event.interpret())
+        return registration
 
-    # Show Flask example
-    print("\n" + "="*70)
-    print("WEBHOOK HANDLER EXAMPLE (Flask)")
-    print("="*70)
-    print(FLASK_WEBHOOK_EXAMPLE)
+    def delete_callback(self, callback_id: str) -> bool:
+        """Simulate removing a callback registration"""
+        registration = self._registrations.pop(callback_id, None)
+        if registration is None:
+            return False
+        if registration.filter.event_types:
+            for event_type in registration.filter._types_set:
+                self._by_event_type[event_type].remove(registration)
+        else:
+            self._all_events.remove(registration)
+        logger.info("✓ Callback %s deleted (SIMULATED)", callback_id)
+        return True
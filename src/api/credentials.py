@@ -12,18 +12,87 @@ Key Concepts:
 - Issuance Token: One-time password for secure provisioning to wallet
 - Lifecycle: PENDING → ACTIVE → SUSPENDED → ACTIVE (or DELETED)
 """
-import uuid
+import logging
+import sys
 import time
 import requests
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from secrets import token_hex
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import datetime, timezone
 from enum import Enum
 
+from ..utils.cache import READ_CACHE_SIZE, TTLCache
+from ..utils.compat import DATACLASS_SLOTS
 from ..utils.config import config
+from ..utils.serialization import dumps, loads
+from ..utils.store import ShardedStore
 from .auth import OrigoAuth, MockOrigoAuth
+from .base import APIClient, AsyncAPIClient
 from .users import User
 
+# Incremental JSON parser for large list responses (optional)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+_BANNER = "=" * 60
+
+# Constant PATCH bodies for lifecycle transitions, encoded once
+_SUSPEND_BODY = dumps({"status": "SUSPENDED"})
+_RESUME_BODY = dumps({"status": "ACTIVE"})
+_STATUS_BODIES = {"SUSPENDED": _SUSPEND_BODY, "ACTIVE": _RESUME_BODY}
+
+# Provisioning walkthrough printed by the verbose mock (see config.verbose_mock)
+_TOKEN_USAGE_DOC = f"\n{_BANNER}\nHOW THE ISSUANCE TOKEN IS USED:\n{_BANNER}\n" + """
+        1. Backend generates this token via GET /pass/{id}/issuanceToken
+
+        2. Token is sent to employee's mobile device via:
+           - Push notification
+           - QR code scan
+           - Deep link / Universal link
+           - Email (less secure)
+
+        3. Mobile app (using HID Mobile Access SDK) initializes with token:
+
+           // iOS (Swift)
+           let manager = OrigoKeysManager.shared
+           manager.provision(issuanceToken: "{token}") { result in
+               switch result {
+               case .success(let credential):
+                   print("Credential provisioned!")
+               case .failure(let error):
+                   print("Provisioning failed: \\(error)")
+               }
+           }
+
+           // Android (Kotlin)
+           origoKeysManager.provision(issuanceToken) { result ->
+               result.onSuccess { credential ->
+                   Log.d("Origo", "Credential provisioned!")
+               }
+               result.onFailure { error ->
+                   Log.e("Origo", "Failed: $error")
+               }
+           }
+
+        4. SDK securely contacts HID Origo cloud to retrieve credential data
+
+        5. Credential is written to device's Secure Element (SE)
+
+        6. Pass appears in Apple Wallet / Google Wallet!
+
+        7. Employee can now tap phone on NFC reader for building access
+        """
+
+# Concurrent requests for bulk operations; stays below the session's
+# connection pool size (see build_session) so threads never wait on a socket
+BULK_WORKERS = 32
+
 
 class PassStatus(Enum):
     """Pass lifecycle states"""
@@ -35,7 +104,38 @@ class PassStatus(Enum):
     DELETED = "DELETED"           # Removed after activation
 
 
-@dataclass
+# Shared empty result for passes without credentials
+_NO_CREDENTIALS: Tuple[Dict[str, Any], ...] = ()
+
+# Status string -> member, avoiding Enum.__call__ when parsing responses
+_STATUS_MAP = {status.value: status for status in PassStatus}
+
+
+def _stream_resources(raw, page: Dict[str, Any]) -> Iterator[Any]:
+    """
+    Yield the Resources items of a SCIM ListResponse as ijson parses them
+
+    totalResults is stored in `page` when the parser reaches it, which may
+    be after the last item.
+    """
+    builder = None
+    for prefix, event, value in ijson.parse(raw, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "Resources.item" and event in ("end_map", "end_array"):
+                yield builder.value
+                builder = None
+        elif prefix == "Resources.item":
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            else:
+                yield value
+        elif prefix == "totalResults" and event == "number":
+            page["totalResults"] = value
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Pass:
     """
     HID Origo Pass model
@@ -52,8 +152,13 @@ class Pass:
     created: Optional[datetime] = None
     platform: Optional[str] = None  # "APPLE" or "GOOGLE"
 
-    # Credential info
-    credentials: List[Dict[str, Any]] = field(default_factory=list)
+    # Credential info; None until the API returns some (see credential_list)
+    credentials: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def credential_list(self) -> Sequence[Dict[str, Any]]:
+        """Credentials on the pass, or an empty sequence if there are none"""
+        return self.credentials if self.credentials is not None else _NO_CREDENTIALS
 
     def to_create_dict(self) -> Dict[str, Any]:
         """Convert to API request format for pass creation"""
@@ -69,13 +174,13 @@ class Pass:
             id=data.get("id"),
             user_id=data.get("userId", ""),
             pass_template_id=data.get("passTemplateId", ""),
-            status=PassStatus(data.get("status", "PENDING")),
+            status=_STATUS_MAP.get(data.get("status"), PassStatus.PENDING),
             platform=data.get("platform"),
-            credentials=data.get("credentials", [])
+            credentials=data.get("credentials") or None
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class IssuanceToken:
     """
     Issuance Token for wallet provisioning
@@ -101,7 +206,7 @@ class IssuanceToken:
         }
 
 
-class CredentialManagementAPI:
+class CredentialManagementAPI(APIClient):
     """
     HID Origo Credential Management API Client
 
@@ -117,13 +222,18 @@ class CredentialManagementAPI:
         token = creds_api.get_issuance_token(pass_obj.id)
     """
 
-    def __init__(self, auth: OrigoAuth, base_url: str = None):
-        self.auth = auth
-        self.base_url = (base_url or config.base_url).rstrip("/")
+    path = "/pass"
 
-    @property
-    def endpoint(self) -> str:
-        return f"{self.base_url}/pass"
+    def __init__(self, auth: OrigoAuth, base_url: str = None, session: requests.Session = None):
+        super().__init__(auth, base_url, session)
+        self._pass_cache = TTLCache(maxsize=READ_CACHE_SIZE, ttl=config.read_cache_ttl)
+
+    def _pass_url(self, pass_id: str) -> str:
+        return f"{self.endpoint}/{pass_id}"
+
+    def invalidate(self, pass_id: str):
+        """Drop a cached get_pass() result, e.g. after an out-of-band change"""
+        self._pass_cache.pop(pass_id)
 
     def create_pass(self, user_id: str, pass_template_id: str) -> Pass:
         """
@@ -141,53 +251,98 @@ class CredentialManagementAPI:
         This creates the pass and allocates credentials based on
         the pass template configuration.
         """
-        print(f"\n{'='*60}")
-        print("STEP 3: Create Pass (Credential Management API)")
-        print(f"{'='*60}")
-        print(f"Endpoint: POST {self.endpoint}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "\n%s\nSTEP 3: Create Pass (Credential Management API)\n%s\nEndpoint: POST %s\n"
+                "\nRequest Body:\n  userId: %s\n  passTemplateId: %s",
+                _BANNER, _BANNER, self.endpoint, user_id, pass_template_id
+            )
 
         pass_obj = Pass(user_id=user_id, pass_template_id=pass_template_id)
-        payload = pass_obj.to_create_dict()
-
-        print(f"\nRequest Body:")
-        print(f"  userId: {user_id}")
-        print(f"  passTemplateId: {pass_template_id}")
-
-        try:
-            response = requests.post(
-                self.endpoint,
-                json=payload,
-                headers=self.auth.get_headers(),
-                timeout=30
+        data = self._request("POST", self.endpoint, pass_obj.to_create_dict(), action="Pass Creation")
+
+        created_pass = Pass.from_api_response(data)
+        self._pass_cache.set(created_pass.id, created_pass)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "\n✓ Pass Created Successfully!\n  Pass ID: %s\n  Status: %s\n  User ID: %s",
+                created_pass.id, created_pass.status.value, created_pass.user_id
             )
-            response.raise_for_status()
-            data = response.json()
 
-            created_pass = Pass.from_api_response(data)
-            print(f"\n✓ Pass Created Successfully!")
-            print(f"  Pass ID: {created_pass.id}")
-            print(f"  Status: {created_pass.status.value}")
-            print(f"  User ID: {created_pass.user_id}")
+        return created_pass
 
-            return created_pass
+    def create_passes(self, items: List[Tuple[str, str]]) -> List[Pass]:
+        """
+        Create passes for (user_id, pass_template_id) pairs concurrently
 
-        except requests.exceptions.RequestException as e:
-            print(f"\n✗ Pass Creation Failed: {e}")
-            raise
+        Requests overlap on the pooled session, so a large onboarding batch
+        is bounded by BULK_WORKERS round trips in flight rather than one at
+        a time. Results are in input order; the first failure is raised.
+        For an asyncio caller, use AsyncCredentialManagementAPI.bulk_create.
+        """
+        with ThreadPoolExecutor(max_workers=BULK_WORKERS, thread_name_prefix="origo-pass") as pool:
+            return list(pool.map(lambda item: self.create_pass(*item), items))
 
     def get_pass(self, pass_id: str) -> Pass:
         """
         Get pass details
 
         GET /pass/{id}
+
+        Served from cache for config.read_cache_ttl seconds after a read
+        or write of the same pass through this client.
         """
-        response = requests.get(
-            f"{self.endpoint}/{pass_id}",
-            headers=self.auth.get_headers(),
-            timeout=30
-        )
-        response.raise_for_status()
-        return Pass.from_api_response(response.json())
+        cached = self._pass_cache.get(pass_id)
+        if cached is not None:
+            return cached
+
+        pass_obj = Pass.from_api_response(self._request("GET", self._pass_url(pass_id)))
+        self._pass_cache.set(pass_id, pass_obj)
+        return pass_obj
+
+    def iter_passes(self, page_size: int = 100) -> Iterator[Pass]:
+        """
+        Iterate over all passes, one page at a time
+
+        GET /pass?startIndex={n}&count={page_size}
+
+        Pages follow the SCIM ListResponse layout ({"Resources": [...]}).
+        With ijson installed each page is parsed straight off the socket,
+        so memory is bounded by one pass rather than a page or the whole
+        list; otherwise each page is buffered and parsed at once.
+
+        Servers may return fewer than `page_size` items per page, so paging
+        stops once totalResults items have been read (or at an empty page
+        if the server omits totalResults).
+        """
+        start_index = 1
+        while True:
+            with self.session.get(
+                self.endpoint,
+                params={"startIndex": start_index, "count": page_size},
+                headers=self.auth.get_headers(),
+                timeout=self.timeout,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                if ijson is not None:
+                    # Let urllib3 undo any gzip/deflate before ijson reads it
+                    response.raw.decode_content = True
+                    page = {}
+                    items = _stream_resources(response.raw, page)
+                else:
+                    page = loads(response.content)
+                    items = page.get("Resources", ())
+
+                received = 0
+                for item in items:
+                    received += 1
+                    yield Pass.from_api_response(item)
+
+            start_index += received
+            total = page.get("totalResults")
+            if not received or (total is not None and start_index > total):
+                return
 
     def get_issuance_token(self, pass_id: str) -> IssuanceToken:
         """
@@ -211,36 +366,28 @@ class CredentialManagementAPI:
         5. Credential is provisioned to Secure Element
         6. Pass appears in Apple/Google Wallet
         """
-        print(f"\n{'='*60}")
-        print("STEP 4: Generate Issuance Token (Credential Management API)")
-        print(f"{'='*60}")
-        print(f"Endpoint: GET {self.endpoint}/{pass_id}/issuanceToken")
-
-        try:
-            response = requests.get(
-                f"{self.endpoint}/{pass_id}/issuanceToken",
-                headers=self.auth.get_headers(),
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
+        logger.debug(
+            "\n%s\nSTEP 4: Generate Issuance Token (Credential Management API)\n%s"
+            "\nEndpoint: GET %s/%s/issuanceToken",
+            _BANNER, _BANNER, self.endpoint, pass_id
+        )
 
-            token = IssuanceToken(
-                token=data.get("issuanceToken", data.get("token", "")),
-                pass_id=pass_id
-            )
+        data = self._request("GET", self._pass_url(pass_id) + "/issuanceToken", action="Token Generation")
 
-            print(f"\n✓ Issuance Token Generated!")
-            print(f"  Token: {token.token[:20]}... (truncated for security)")
-            print(f"  Pass ID: {pass_id}")
-            print(f"\n  ⚠️  IMPORTANT: This token is ONE-TIME USE ONLY!")
-            print(f"  ⚠️  Do not log, store, or transmit insecurely!")
+        token = IssuanceToken(
+            token=data.get("issuanceToken", data.get("token", "")),
+            pass_id=pass_id
+        )
 
-            return token
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "\n✓ Issuance Token Generated!\n  Token: %s... (truncated for security)"
+                "\n  Pass ID: %s\n\n  ⚠️  IMPORTANT: This token is ONE-TIME USE ONLY!"
+                "\n  ⚠️  Do not log, store, or transmit insecurely!",
+                token.token[:20], pass_id
+            )
 
-        except requests.exceptions.RequestException as e:
-            print(f"\n✗ Token Generation Failed: {e}")
-            raise
+        return token
 
     # =========================================================================
     # Lifecycle Operations (Suspend, Resume, Delete)
@@ -255,23 +402,18 @@ class CredentialManagementAPI:
 
         Use case: Employee on leave, lost device, security incident
         """
-        print(f"\n{'='*60}")
-        print("LIFECYCLE: Suspend Pass")
-        print(f"{'='*60}")
-        print(f"Endpoint: PATCH {self.endpoint}/{pass_id}")
-
-        payload = {"status": "SUSPENDED"}
-
-        response = requests.patch(
-            f"{self.endpoint}/{pass_id}",
-            json=payload,
-            headers=self.auth.get_headers(),
-            timeout=30
+        logger.debug(
+            "\n%s\nLIFECYCLE: Suspend Pass\n%s\nEndpoint: PATCH %s/%s",
+            _BANNER, _BANNER, self.endpoint, pass_id
         )
-        response.raise_for_status()
 
-        print(f"✓ Pass suspended successfully")
-        return Pass.from_api_response(response.json())
+        self._pass_cache.pop(pass_id)
+        data = self._request("PATCH", self._pass_url(pass_id), _SUSPEND_BODY)
+
+        logger.info("✓ Pass %s suspended", pass_id)
+        pass_obj = Pass.from_api_response(data)
+        self._pass_cache.set(pass_id, pass_obj)
+        return pass_obj
 
     def resume_pass(self, pass_id: str) -> Pass:
         """
@@ -282,23 +424,18 @@ class CredentialManagementAPI:
 
         Use case: Employee returns from leave, device found
         """
-        print(f"\n{'='*60}")
-        print("LIFECYCLE: Resume Pass")
-        print(f"{'='*60}")
-        print(f"Endpoint: PATCH {self.endpoint}/{pass_id}")
-
-        payload = {"status": "ACTIVE"}
-
-        response = requests.patch(
-            f"{self.endpoint}/{pass_id}",
-            json=payload,
-            headers=self.auth.get_headers(),
-            timeout=30
+        logger.debug(
+            "\n%s\nLIFECYCLE: Resume Pass\n%s\nEndpoint: PATCH %s/%s",
+            _BANNER, _BANNER, self.endpoint, pass_id
         )
-        response.raise_for_status()
 
-        print(f"✓ Pass resumed successfully")
-        return Pass.from_api_response(response.json())
+        self._pass_cache.pop(pass_id)
+        data = self._request("PATCH", self._pass_url(pass_id), _RESUME_BODY)
+
+        logger.info("✓ Pass %s resumed", pass_id)
+        pass_obj = Pass.from_api_response(data)
+        self._pass_cache.set(pass_id, pass_obj)
+        return pass_obj
 
     def delete_pass(self, pass_id: str) -> bool:
         """
@@ -308,21 +445,89 @@ class CredentialManagementAPI:
 
         Use case: Employee termination, credential replacement
         """
-        print(f"\n{'='*60}")
-        print("LIFECYCLE: Delete Pass")
-        print(f"{'='*60}")
-        print(f"Endpoint: DELETE {self.endpoint}/{pass_id}")
-
-        response = requests.delete(
-            f"{self.endpoint}/{pass_id}",
-            headers=self.auth.get_headers(),
-            timeout=30
+        logger.debug(
+            "\n%s\nLIFECYCLE: Delete Pass\n%s\nEndpoint: DELETE %s/%s",
+            _BANNER, _BANNER, self.endpoint, pass_id
+        )
+
+        self._pass_cache.pop(pass_id)
+        self._request("DELETE", self._pass_url(pass_id))
+
+        logger.info("✓ Pass %s deleted", pass_id)
+        return True
+
+
+class AsyncCredentialManagementAPI(AsyncAPIClient):
+    """
+    Asynchronous Credential Management API Client
+
+    Same operations as CredentialManagementAPI over HTTP/2, plus bulk
+    variants (create, suspend, resume, delete) that run concurrently on
+    one multiplexed connection.
+
+    Usage:
+        async with AsyncCredentialManagementAPI(auth) as creds_api:
+            passes = await creds_api.bulk_create([(user_id, template_id), ...])
+
+        # From synchronous code
+        creds_api.run_sync(creds_api.bulk_suspend(pass_ids))
+    """
+
+    path = "/pass"
+
+    def _pass_url(self, pass_id: str) -> str:
+        return f"{self.endpoint}/{pass_id}"
+
+    async def create_pass(self, user_id: str, pass_template_id: str) -> Pass:
+        """Create a new pass for a user - see CredentialManagementAPI.create_pass"""
+        payload = Pass(user_id=user_id, pass_template_id=pass_template_id).to_create_dict()
+        return Pass.from_api_response(await self._request("POST", self.endpoint, payload))
+
+    async def get_pass(self, pass_id: str) -> Pass:
+        """Get pass details"""
+        return Pass.from_api_response(await self._request("GET", self._pass_url(pass_id)))
+
+    async def get_issuance_token(self, pass_id: str) -> IssuanceToken:
+        """Generate an issuance token for wallet provisioning"""
+        data = await self._request("GET", self._pass_url(pass_id) + "/issuanceToken")
+        return IssuanceToken(
+            token=data.get("issuanceToken", data.get("token", "")),
+            pass_id=pass_id
         )
-        response.raise_for_status()
 
-        print(f"✓ Pass deleted successfully")
+    async def _set_status(self, pass_id: str, status: str) -> Pass:
+        data = await self._request("PATCH", self._pass_url(pass_id), _STATUS_BODIES[status])
+        return Pass.from_api_response(data)
+
+    async def suspend_pass(self, pass_id: str) -> Pass:
+        """Suspend a pass (temporarily disable)"""
+        return await self._set_status(pass_id, "SUSPENDED")
+
+    async def resume_pass(self, pass_id: str) -> Pass:
+        """Resume a suspended pass"""
+        return await self._set_status(pass_id, "ACTIVE")
+
+    async def delete_pass(self, pass_id: str) -> bool:
+        """Delete a pass permanently"""
+        await self._request("DELETE", self._pass_url(pass_id))
         return True
 
+    async def bulk_create(self, items: List[Tuple[str, str]]) -> List[Pass]:
+        """Create passes for (user_id, pass_template_id) pairs concurrently"""
+        return await self._gather_bounded(lambda item: self.create_pass(*item), items)
+
+    async def bulk_suspend(self, pass_ids: List[str]) -> List[Pass]:
+        """Suspend several passes concurrently (e.g. a whole department)"""
+        return await self._gather_bounded(self.suspend_pass, pass_ids)
+
+    async def bulk_resume(self, pass_ids: List[str]) -> List[Pass]:
+        """Resume several passes concurrently"""
+        return await self._gather_bounded(self.resume_pass, pass_ids)
+
+    async def bulk_delete(self, pass_ids: List[str]) -> List[bool]:
+        """Delete several passes concurrently"""
+        return await self._gather_bounded(self.delete_pass, pass_ids)
+
 
 # =============================================================================
 # MOCK: Simulated API for Testing
@@ -331,165 +536,117 @@ class CredentialManagementAPI:
 class MockCredentialManagementAPI(CredentialManagementAPI):
     """Mock Credential Management API for testing"""
 
-    def __init__(self, auth: MockOrigoAuth = None):
-        self.auth = auth or MockOrigoAuth()
-        self.base_url = "https://api.origo.hidglobal.com"
-        self._passes: Dict[str, Pass] = {}
+    def __init__(self, auth: MockOrigoAuth = None, verbose: bool = None):
+        super().__init__(auth or MockOrigoAuth(), base_url="https://api.origo.hidglobal.com")
+        self._passes = ShardedStore()
+        self._mock_latency = config.mock_latency_ms / 1000
+        # Explain how issuance tokens are used after generating one
+        self._verbose = config.verbose_mock if verbose is None else verbose
 
     def create_pass(self, user_id: str, pass_template_id: str) -> Pass:
         """Simulate pass creation"""
-        print(f"\n{'='*60}")
-        print("STEP 3: Create Pass (Credential Management API) - SIMULATED")
-        print(f"{'='*60}")
-        print(f"Endpoint: POST {self.endpoint}")
-
-        print(f"\nRequest Body:")
-        print(f"  {{")
-        print(f'    "userId": "{user_id}",')
-        print(f'    "passTemplateId": "{pass_template_id}"')
-        print(f"  }}")
+        logger.debug(
+            "\n%s\nSTEP 3: Create Pass (Credential Management API) - SIMULATED\n%s"
+            '\nEndpoint: POST %s\n\nRequest Body:\n  {\n    "userId": "%s",'
+            '\n    "passTemplateId": "%s"\n  }',
+            _BANNER, _BANNER, self.endpoint, user_id, pass_template_id
+        )
 
-        time.sleep(0.3)
+        if self._mock_latency:
+            time.sleep(self._mock_latency)
 
         # Generate mock pass
         pass_obj = Pass(
-            id=f"pass-{uuid.uuid4().hex[:12]}",
+            id=f"pass-{token_hex(6)}",
             user_id=user_id,
             pass_template_id=pass_template_id,
             status=PassStatus.PENDING,
-            created=datetime.utcnow(),
+            created=datetime.now(timezone.utc),
             credentials=[
                 {
                     "type": "SEOS",
-                    "id": f"cred-{uuid.uuid4().hex[:8]}"
+                    "id": f"cred-{token_hex(4)}"
                 }
             ]
         )
 
         self._passes[pass_obj.id] = pass_obj
 
-        print(f"\n✓ Pass Created Successfully! (SIMULATED)")
-        print(f"  Pass ID: {pass_obj.id}")
-        print(f"  Status: {pass_obj.status.value}")
-        print(f"  User ID: {pass_obj.user_id}")
-        print(f"  Template: {pass_obj.pass_template_id}")
-        print(f"\nResponse (simulated):")
-        print(f"  {{")
-        print(f'    "id": "{pass_obj.id}",')
-        print(f'    "userId": "{user_id}",')
-        print(f'    "passTemplateId": "{pass_template_id}",')
-        print(f'    "status": "PENDING",')
-        print(f'    "credentials": [{{"type": "SEOS", "id": "..."}}]')
-        print(f"  }}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "\n✓ Pass Created Successfully! (SIMULATED)\n  Pass ID: %s\n  Status: %s"
+                "\n  User ID: %s\n  Template: %s\n\nResponse (simulated):\n  {"
+                '\n    "id": "%s",\n    "userId": "%s",\n    "passTemplateId": "%s",'
+                '\n    "status": "PENDING",\n    "credentials": [{"type": "SEOS", "id": "..."}]\n  }',
+                pass_obj.id, pass_obj.status.value, pass_obj.user_id, pass_obj.pass_template_id,
+                pass_obj.id, user_id, pass_template_id
+            )
 
         return pass_obj
 
     def get_issuance_token(self, pass_id: str) -> IssuanceToken:
         """Simulate issuance token generation"""
-        print(f"\n{'='*60}")
-        print("STEP 4: Generate Issuance Token - SIMULATED")
-        print(f"{'='*60}")
-        print(f"Endpoint: GET {self.endpoint}/{pass_id}/issuanceToken")
+        logger.debug(
+            "\n%s\nSTEP 4: Generate Issuance Token - SIMULATED\n%s\nEndpoint: GET %s/%s/issuanceToken",
+            _BANNER, _BANNER, self.endpoint, pass_id
+        )
 
-        time.sleep(0.3)
+        if self._mock_latency:
+            time.sleep(self._mock_latency)
 
         # Generate mock token (in reality, this is a cryptographically secure token)
-        mock_token = f"IT_{uuid.uuid4().hex}"
+        mock_token = f"IT_{token_hex(16)}"
 
         token = IssuanceToken(
             token=mock_token,
             pass_id=pass_id
         )
 
-        print(f"\n✓ Issuance Token Generated! (SIMULATED)")
-        print(f"\nResponse (simulated):")
-        print(f"  {{")
-        print(f'    "issuanceToken": "{token.token[:30]}..."')
-        print(f"  }}")
-        print(f"\n  ⚠️  IMPORTANT: This token is ONE-TIME USE ONLY!")
-        print(f"\n" + "="*60)
-        print("HOW THE ISSUANCE TOKEN IS USED:")
-        print("="*60)
-        print("""
-        1. Backend generates this token via GET /pass/{id}/issuanceToken
-
-        2. Token is sent to employee's mobile device via:
-           - Push notification
-           - QR code scan
-           - Deep link / Universal link
-           - Email (less secure)
-
-        3. Mobile app (using HID Mobile Access SDK) initializes with token:
-
-           // iOS (Swift)
-           let manager = OrigoKeysManager.shared
-           manager.provision(issuanceToken: "{token}") { result in
-               switch result {
-               case .success(let credential):
-                   print("Credential provisioned!")
-               case .failure(let error):
-                   print("Provisioning failed: \\(error)")
-               }
-           }
-
-           // Android (Kotlin)
-           origoKeysManager.provision(issuanceToken) { result ->
-               result.onSuccess { credential ->
-                   Log.d("Origo", "Credential provisioned!")
-               }
-               result.onFailure { error ->
-                   Log.e("Origo", "Failed: $error")
-               }
-           }
-
-        4. SDK securely contacts HID Origo cloud to retrieve credential data
+        logger.info(
+            "\n✓ Issuance Token Generated! (SIMULATED)\n\nResponse (simulated):\n  {"
+            '\n    "issuanceToken": "%s..."\n  }\n\n  ⚠️  IMPORTANT: This token is ONE-TIME USE ONLY!',
+            token.token[:30]
+        )
 
-        5. Credential is written to device's Secure Element (SE)
-
-        6. Pass appears in Apple Wallet / Google Wallet!
-
-        7. Employee can now tap phone on NFC reader for building access
-        """)
+        if self._verbose:
+            logger.info("%s", _TOKEN_USAGE_DOC)
 
         return token
 
     def suspend_pass(self, pass_id: str) -> Pass:
         """Simulate pass suspension"""
-        print(f"\n{'='*60}")
-        print("LIFECYCLE: Suspend Pass - SIMULATED")
-        print(f"{'='*60}")
-
-        if pass_id in self._passes:
-            self._passes[pass_id].status = PassStatus.SUSPENDED
-            print(f"✓ Pass {pass_id} suspended")
-            return self._passes[pass_id]
+        logger.debug("\n%s\nLIFECYCLE: Suspend Pass - SIMULATED\n%s", _BANNER, _BANNER)
+
+        pass_obj = self._passes.get(pass_id)
+        if pass_obj is not None:
+            pass_obj.status = PassStatus.SUSPENDED
+            logger.info("✓ Pass %s suspended", pass_id)
+            return pass_obj
         raise ValueError(f"Pass not found: {pass_id}")
 
     def resume_pass(self, pass_id: str) -> Pass:
         """Simulate pass resume"""
-        print(f"\n{'='*60}")
-        print("LIFECYCLE: Resume Pass - SIMULATED")
-        print(f"{'='*60}")
-
-        if pass_id in self._passes:
-            self._passes[pass_id].status = PassStatus.ACTIVE
-            print(f"✓ Pass {pass_id} resumed")
-            return self._passes[pass_id]
+        logger.debug("\n%s\nLIFECYCLE: Resume Pass - SIMULATED\n%s", _BANNER, _BANNER)
+
+        pass_obj = self._passes.get(pass_id)
+        if pass_obj is not None:
+            pass_obj.status = PassStatus.ACTIVE
+            logger.info("✓ Pass %s resumed", pass_id)
+            return pass_obj
         raise ValueError(f"Pass not found: {pass_id}")
 
     def delete_pass(self, pass_id: str) -> bool:
         """Simulate pass deletion"""
-        print(f"\n{'='*60}")
-        print("LIFECYCLE: Delete Pass - SIMULATED")
-        print(f"{'='*60}")
+        logger.debug("\n%s\nLIFECYCLE: Delete Pass - SIMULATED\n%s", _BANNER, _BANNER)
 
-        if pass_id in self._passes:
-            del self._passes[pass_id]
-        print(f"✓ Pass {pass_id} deleted")
+        self._passes.pop(pass_id)
+        logger.info("✓ Pass %s deleted", pass_id)
         return True
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
+
     # Demo the credential management flow
     print("\n" + "="*70)
     print("HID ORIGO CREDENTIAL MANAGEMENT DEMO")
@@ -504,7 +661,7 @@ if __name__ == "__main__":
     auth.authenticate()
 
     # Mock credential API
-    creds_api = MockCredentialManagementAPI(auth)
+    creds_api = MockCredentialManagementAPI(auth, verbose=True)
 
     # Create a pass
     user_id = "usr-abc123"
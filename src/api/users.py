@@ -11,18 +11,34 @@ Key Concepts:
 - Users are required before passes can be issued
 - External ID links corporate identity to Origo user
 """
-import uuid
+import logging
+import sys
 import time
 import requests
+from secrets import token_hex
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
+from ..utils.cache import READ_CACHE_SIZE, TTLCache
+from ..utils.compat import DATACLASS_SLOTS
 from ..utils.config import config
+from ..utils.serialization import dumps
+from ..utils.store import ShardedStore
 from .auth import OrigoAuth, MockOrigoAuth
+from .base import APIClient, AsyncAPIClient
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+_BANNER = "=" * 60
+
+_SCIM_SCHEMAS = ("urn:ietf:params:scim:schemas:core:2.0:User",)
+
+# Bound on cached externalId -> user mappings (one per employee synced)
+EXTERNAL_ID_CACHE_SIZE = 100_000
+
+
+@dataclass(**DATACLASS_SLOTS)
 class User:
     """
     HID Origo User model (SCIM v2 format)
@@ -46,10 +62,12 @@ class User:
     created: Optional[datetime] = None
     last_modified: Optional[datetime] = None
 
+    _scim_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
     def to_scim_dict(self) -> Dict[str, Any]:
-        """Convert to SCIM v2 request format"""
+        """Convert to SCIM v2 request format (a new dict on every call)"""
         return {
-            "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+            "schemas": list(_SCIM_SCHEMAS),
             "externalId": self.external_id,
             "displayName": self.display_name or f"{self.given_name} {self.family_name}".strip(),
             "name": {
@@ -65,6 +83,29 @@ class User:
             ]
         }
 
+    def to_scim_json(self) -> bytes:
+        """
+        SCIM v2 request body, encoded once and cached
+
+        Re-encoded only when a field the body depends on changes.
+        """
+        key = (self.external_id, self.email, self.display_name, self.given_name, self.family_name)
+        cached = self._scim_cache
+        if cached is None or cached[0] != key:
+            cached = (key, dumps(self.to_scim_dict()))
+            self._scim_cache = cached
+        return cached[1]
+
+    @staticmethod
+    def bulk_to_scim(users: List["User"]) -> List[Dict[str, Any]]:
+        """SCIM v2 request bodies for a batch of users"""
+        return [user.to_scim_dict() for user in users]
+
+    @staticmethod
+    def bulk_to_scim_json(users: List["User"]) -> bytes:
+        """JSON array of SCIM v2 bodies, joined from each user's cached encoding"""
+        return b"[" + b",".join([user.to_scim_json() for user in users]) + b"]"
+
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> "User":
         """Create User from API response"""
@@ -82,7 +123,7 @@ class User:
         )
 
 
-class UserManagementAPI:
+class UserManagementAPI(APIClient):
     """
     HID Origo User Management API Client
 
@@ -95,13 +136,40 @@ class UserManagementAPI:
         user = users_api.create_user(User(...))
     """
 
-    def __init__(self, auth: OrigoAuth, base_url: str = None):
-        self.auth = auth
-        self.base_url = (base_url or config.base_url).rstrip("/")
+    path = "/user"
+
+    def __init__(self, auth: OrigoAuth, base_url: str = None, session: requests.Session = None):
+        super().__init__(auth, base_url, session)
+        self._user_cache = TTLCache(maxsize=READ_CACHE_SIZE, ttl=config.read_cache_ttl)
+        # Keyed by externalId only: it is the identity a sync job upserts on
+        self._user_by_external_id = TTLCache(
+            maxsize=EXTERNAL_ID_CACHE_SIZE, ttl=config.external_id_cache_ttl
+        )
+        # Reverse index (user id -> externalId) so deletes forget a mapping
+        # without scanning the cache
+        self._external_id_by_user = TTLCache(
+            maxsize=EXTERNAL_ID_CACHE_SIZE, ttl=config.external_id_cache_ttl
+        )
+
+    def _user_url(self, user_id: str) -> str:
+        return f"{self.endpoint}/{user_id}"
 
-    @property
-    def endpoint(self) -> str:
-        return f"{self.base_url}/user"
+    def invalidate(self, user_id: str):
+        """Drop cached results for a user, e.g. after an out-of-band change"""
+        self._user_cache.pop(user_id)
+        self._forget_external_id(user_id)
+
+    def _remember_external_id(self, external_id: str, user: User):
+        self._user_by_external_id.set(external_id, user)
+        self._external_id_by_user.set(user.id, external_id)
+
+    def _forget_external_id(self, user_id: str):
+        external_id = self._external_id_by_user.pop(user_id)
+        if external_id is None:
+            return
+        cached = self._user_by_external_id.get(external_id)
+        if cached is not None and cached.id == user_id:
+            self._user_by_external_id.pop(external_id)
 
     def create_user(self, user: User) -> User:
         """
@@ -113,55 +181,77 @@ class UserManagementAPI:
         This is STEP 1 of the provisioning flow - you need a user
         before you can create a pass/credential for them.
         """
-        print(f"\n{'='*60}")
-        print("STEP 2: Create User (User Management API)")
-        print(f"{'='*60}")
-        print(f"Endpoint: POST {self.endpoint}")
-
-        payload = user.to_scim_dict()
-        print(f"\nRequest Body (SCIM v2 format):")
-        print(f"  externalId: {user.external_id}")
-        print(f"  displayName: {user.display_name}")
-        print(f"  email: {user.email}")
-        print(f"  givenName: {user.given_name}")
-        print(f"  familyName: {user.family_name}")
-
-        try:
-            response = requests.post(
-                self.endpoint,
-                json=payload,
-                headers=self.auth.get_headers(),
-                timeout=30
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "\n%s\nSTEP 2: Create User (User Management API)\n%s\nEndpoint: POST %s\n"
+                "\nRequest Body (SCIM v2 format):\n  externalId: %s\n  displayName: %s"
+                "\n  email: %s\n  givenName: %s\n  familyName: %s",
+                _BANNER, _BANNER, self.endpoint,
+                user.external_id, user.display_name, user.email,
+                user.given_name, user.family_name
             )
-            response.raise_for_status()
-            data = response.json()
 
-            created_user = User.from_api_response(data)
-            print(f"\n✓ User Created Successfully!")
-            print(f"  User ID: {created_user.id}")
-            print(f"  External ID: {created_user.external_id}")
+        data = self._request("POST", self.endpoint, user.to_scim_json(), action="User Creation")
 
-            return created_user
+        created_user = User.from_api_response(data)
+        self._user_cache.set(created_user.id, created_user)
+        logger.info(
+            "\n✓ User Created Successfully!\n  User ID: %s\n  External ID: %s",
+            created_user.id, created_user.external_id
+        )
 
-        except requests.exceptions.RequestException as e:
-            print(f"\n✗ User Creation Failed: {e}")
-            raise
+        return created_user
 
     def get_user(self, user_id: str) -> User:
         """
         Get user details by ID
 
         GET /user/{id}
+
+        Served from cache for config.read_cache_ttl seconds after a read
+        or write of the same user through this client.
         """
-        print(f"\nGetting user: {user_id}")
+        cached = self._user_cache.get(user_id)
+        if cached is not None:
+            return cached
 
-        response = requests.get(
-            f"{self.endpoint}/{user_id}",
-            headers=self.auth.get_headers(),
-            timeout=30
-        )
-        response.raise_for_status()
-        return User.from_api_response(response.json())
+        logger.debug("Getting user: %s", user_id)
+
+        user = User.from_api_response(self._request("GET", self._user_url(user_id)))
+        self._user_cache.set(user_id, user)
+        return user
+
+    def find_user_by_external_id(self, external_id: str) -> Optional[User]:
+        """
+        Look up a user by corporate identifier
+
+        GET /user?filter=externalId eq "{external_id}"
+        """
+        escaped = external_id.replace("\\", "\\\\").replace('"', '\\"')
+        data = self._request("GET", self.endpoint, params={"filter": f'externalId eq "{escaped}"'})
+        resources = data.get("Resources")
+        return User.from_api_response(resources[0]) if resources else None
+
+    def get_or_create_user(self, user: User) -> User:
+        """
+        Return the Origo user for user.external_id, creating it if needed
+
+        For nightly sync jobs where almost every employee already exists:
+        a cached mapping answers without any request, a miss costs one
+        filtered GET, and only unknown users are POSTed.
+        """
+        external_id = user.external_id
+        cached = self._user_by_external_id.get(external_id)
+        if cached is not None:
+            # Keep the reverse entry as recently used as the forward one
+            self._external_id_by_user.get(cached.id)
+            return cached
+
+        existing = self.find_user_by_external_id(external_id)
+        if existing is None:
+            existing = self.create_user(user)
+        self._remember_external_id(external_id, existing)
+        return existing
 
     def delete_user(self, user_id: str) -> bool:
         """
@@ -171,17 +261,52 @@ class UserManagementAPI:
 
         This will also invalidate any passes associated with the user.
         """
-        print(f"\nDeleting user: {user_id}")
+        logger.debug("Deleting user: %s", user_id)
+        self.invalidate(user_id)
 
-        response = requests.delete(
-            f"{self.endpoint}/{user_id}",
-            headers=self.auth.get_headers(),
-            timeout=30
-        )
-        response.raise_for_status()
-        print(f"✓ User deleted successfully")
+        self._request("DELETE", self._user_url(user_id))
+        logger.info("✓ User %s deleted", user_id)
+        return True
+
+
+class AsyncUserManagementAPI(AsyncAPIClient):
+    """
+    Asynchronous User Management API Client
+
+    Same operations as UserManagementAPI over HTTP/2, plus bulk variants
+    that run concurrently on one multiplexed connection.
+
+    Usage:
+        async with AsyncUserManagementAPI(auth) as users_api:
+            created = await users_api.bulk_create(users)
+    """
+
+    path = "/user"
+
+    def _user_url(self, user_id: str) -> str:
+        return f"{self.endpoint}/{user_id}"
+
+    async def create_user(self, user: User) -> User:
+        """Create a new user - see UserManagementAPI.create_user"""
+        return User.from_api_response(await self._request("POST", self.endpoint, user.to_scim_json()))
+
+    async def get_user(self, user_id: str) -> User:
+        """Get user details by ID"""
+        return User.from_api_response(await self._request("GET", self._user_url(user_id)))
+
+    async def delete_user(self, user_id: str) -> bool:
+        """Delete a user (lifecycle operation)"""
+        await self._request("DELETE", self._user_url(user_id))
         return True
 
+    async def bulk_create(self, users: List[User]) -> List[User]:
+        """Create several users concurrently"""
+        return await self._gather_bounded(self.create_user, users)
+
+    async def bulk_delete(self, user_ids: List[str]) -> List[bool]:
+        """Delete several users concurrently"""
+        return await self._gather_bounded(self.delete_user, user_ids)
+
 
 # =============================================================================
 # MOCK: Simulated API for Testing
@@ -191,72 +316,80 @@ class MockUserManagementAPI(UserManagementAPI):
     """Mock User Management API for testing without real credentials"""
 
     def __init__(self, auth: MockOrigoAuth = None):
-        self.auth = auth or MockOrigoAuth()
-        self.base_url = "https://api.origo.hidglobal.com"
-        self._users: Dict[str, User] = {}
+        super().__init__(auth or MockOrigoAuth(), base_url="https://api.origo.hidglobal.com")
+        self._users = ShardedStore()
+        self._mock_latency = config.mock_latency_ms / 1000
 
     def create_user(self, user: User) -> User:
         """Simulate user creation"""
-        print(f"\n{'='*60}")
-        print("STEP 2: Create User (User Management API) - SIMULATED")
-        print(f"{'='*60}")
-        print(f"Endpoint: POST {self.endpoint}")
-
-        payload = user.to_scim_dict()
-        print(f"\nRequest Body (SCIM v2 format):")
-        print(f"  schemas: {payload['schemas']}")
-        print(f"  externalId: {user.external_id}")
-        print(f"  displayName: {user.display_name}")
-        print(f"  email: {user.email}")
-        print(f"  name.givenName: {user.given_name}")
-        print(f"  name.familyName: {user.family_name}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "\n%s\nSTEP 2: Create User (User Management API) - SIMULATED\n%s"
+                "\nEndpoint: POST %s\n\nRequest Body (SCIM v2 format):\n  schemas: %s"
+                "\n  externalId: %s\n  displayName: %s\n  email: %s"
+                "\n  name.givenName: %s\n  name.familyName: %s",
+                _BANNER, _BANNER, self.endpoint, list(_SCIM_SCHEMAS),
+                user.external_id, user.display_name, user.email,
+                user.given_name, user.family_name
+            )
 
         # Simulate network delay
-        time.sleep(0.3)
+        if self._mock_latency:
+            time.sleep(self._mock_latency)
 
         # Generate mock ID
-        user.id = f"usr-{uuid.uuid4().hex[:12]}"
-        user.created = datetime.utcnow()
-        user.last_modified = datetime.utcnow()
+        user.id = f"usr-{token_hex(6)}"
+        now = datetime.now(timezone.utc)
+        user.created = now
+        user.last_modified = now
 
         self._users[user.id] = user
 
-        print(f"\n✓ User Created Successfully! (SIMULATED)")
-        print(f"  User ID: {user.id}")
-        print(f"  External ID: {user.external_id}")
-        print(f"\nResponse (simulated):")
-        print(f"  {{")
-        print(f'    "id": "{user.id}",')
-        print(f'    "externalId": "{user.external_id}",')
-        print(f'    "displayName": "{user.display_name}",')
-        print(f'    "emails": [{{"value": "{user.email}", "primary": true}}]')
-        print(f"  }}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "\n✓ User Created Successfully! (SIMULATED)\n  User ID: %s\n  External ID: %s"
+                '\n\nResponse (simulated):\n  {\n    "id": "%s",\n    "externalId": "%s",'
+                '\n    "displayName": "%s",\n    "emails": [{"value": "%s", "primary": true}]\n  }',
+                user.id, user.external_id, user.id, user.external_id,
+                user.display_name, user.email
+            )
 
         return user
 
     def get_user(self, user_id: str) -> User:
         """Simulate getting user"""
-        if user_id in self._users:
-            return self._users[user_id]
+        user = self._users.get(user_id)
+        if user is not None:
+            return user
         raise ValueError(f"User not found: {user_id}")
 
+    def find_user_by_external_id(self, external_id: str) -> Optional[User]:
+        """Simulate the externalId filter query"""
+        for user in self._users.values():
+            if user.external_id == external_id:
+                return user
+        return None
+
     def delete_user(self, user_id: str) -> bool:
         """Simulate user deletion"""
-        print(f"\n{'='*60}")
-        print("DELETE User (SIMULATED)")
-        print(f"{'='*60}")
-        print(f"Endpoint: DELETE {self.endpoint}/{user_id}")
+        logger.debug(
+            "\n%s\nDELETE User (SIMULATED)\n%s\nEndpoint: DELETE %s/%s",
+            _BANNER, _BANNER, self.endpoint, user_id
+        )
 
-        time.sleep(0.2)
+        if self._mock_latency:
+            time.sleep(self._mock_latency)
 
-        if user_id in self._users:
-            del self._users[user_id]
+        self._users.pop(user_id)
+        self._forget_external_id(user_id)
 
-        print(f"\n✓ User deleted successfully (SIMULATED)")
+        logger.info("\n✓ User deleted successfully (SIMULATED)")
         return True
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
+
     # Demo the user management flow
     print("\n" + "="*70)
     print("HID ORIGO USER MANAGEMENT DEMO")
@@ -0,0 +1,218 @@
+"""
+Part 4: Webhook Receiver
+========================
+Flask endpoint for HID Origo event callbacks
+
+This is the endpoint registered through CallbackAPI.register_callback.
+HID Origo POSTs CloudEvents batches to it and expects HTTP 200 OK.
+
+Key Concepts:
+- Authentication uses the httpHeader + secret set at registration
+- Secrets are compared in constant time to avoid timing leaks
+- Events in a batch are handled concurrently, since handlers do I/O
+
+Run with: python -m src.api.webhook
+"""
+import hmac
+import logging
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+
+from flask import Flask, request, jsonify
+
+from ..utils.config import config
+from ..utils.serialization import loads
+from .callbacks import CloudEvent, EventType
+
+# Incremental JSON parser for large batches (optional)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+app = Flask(__name__)
+
+# Your callback secret (set during registration)
+WEBHOOK_SECRET = config.callback_secret
+
+# Encoded once at import instead of on every request
+_EXPECTED_AUTH = f"Bearer {WEBHOOK_SECRET}".encode()
+
+# Handlers do database/notification I/O, so a batch is processed in
+# parallel. Origo retries deliveries that are not acknowledged in time,
+# so the response is sent after at most BATCH_TIMEOUT seconds.
+BATCH_TIMEOUT = 25
+_HANDLER_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="origo-evt")
+
+# Events parsed but not yet handled, per request. With ijson installed the
+# batch is read incrementally and parsing pauses while this many are queued,
+# so memory tracks the queue depth rather than the size of the batch.
+MAX_PENDING_EVENTS = 256
+
+
+@app.route("/webhooks/origo", methods=["POST"])
+def handle_origo_webhook():
+    """
+    Webhook endpoint for HID Origo events
+
+    Requirements:
+    - Accept POST requests
+    - Content-Type: application/cloudevents-batch+json
+    - Return HTTP 200 OK
+    """
+    # Verify authentication; fails closed when no secret is configured
+    auth_header = request.headers.get("Authorization", "").encode()
+    if not WEBHOOK_SECRET or not hmac.compare_digest(auth_header, _EXPECTED_AUTH):
+        return jsonify({"error": "Unauthorized"}), 401
+
+    deadline = time.monotonic() + BATCH_TIMEOUT
+
+    # Parse CloudEvents batch; malformed events are logged and skipped so
+    # they do not make Origo redeliver the whole batch
+    if ijson is not None:
+        futures = _submit_streamed(request.stream, deadline)
+    else:
+        futures = [
+            _HANDLER_POOL.submit(_dispatch, event)
+            for event in CloudEvent.from_batch(loads(request.get_data(cache=False)))
+        ]
+
+    _, not_done = wait(futures, timeout=max(deadline - time.monotonic(), 0))
+    if not_done:
+        # Still acknowledge: a non-200 makes Origo redeliver the whole batch
+        logger.warning(
+            "%d of %d events still processing after %ss",
+            len(not_done), len(futures), BATCH_TIMEOUT
+        )
+
+    # CRITICAL: Return 200 OK to acknowledge receipt
+    return jsonify({"status": "received"}), 200
+
+
+def _parse_event(payload) -> Optional[CloudEvent]:
+    """CloudEvent for one batch item, or None (logged) if it is malformed"""
+    try:
+        return CloudEvent.from_dict(payload)
+    except (AttributeError, TypeError, ValueError) as e:
+        event_id = payload.get("id") if isinstance(payload, dict) else None
+        logger.warning("Skipping malformed event %s: %s", event_id, e)
+        return None
+
+
+class _NoProbeReader:
+    """
+    Byte stream for ijson that answers its read(0) probe locally
+
+    Werkzeug's LimitedStream treats an empty read as a client disconnect,
+    and servers that set wsgi.input_terminated (gunicorn) pass the raw
+    input through, which may offer nothing but read(). Only non-empty
+    reads reach the underlying stream.
+    """
+    __slots__ = ("_stream",)
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size) if size else b""
+
+
+def _submit_streamed(stream, deadline: float) -> list:
+    """
+    Parse a batch item by item, submitting each event as it completes
+
+    Parsing waits for a free MAX_PENDING_EVENTS slot only until `deadline`;
+    after that the rest of the batch is submitted without waiting, so the
+    response is not held back by slow handlers.
+    """
+    pending = threading.BoundedSemaphore(MAX_PENDING_EVENTS)
+    futures = []
+    for payload in ijson.items(_NoProbeReader(stream), "item", use_float=True):
+        event = _parse_event(payload)
+        if event is None:
+            continue
+        acquired = pending.acquire(timeout=max(deadline - time.monotonic(), 0))
+        future = _HANDLER_POOL.submit(_dispatch, event)
+        if acquired:
+            future.add_done_callback(lambda _: pending.release())
+        futures.append(future)
+    return futures
+
+
+def _dispatch(event: CloudEvent):
+    """Run the handler registered for the event's type"""
+    logger.info(
+        "Received event: %s\n  Subject: %s\n  Data: %s",
+        event.type, event.subject, event.data
+    )
+    handler = _HANDLERS.get(event.type)
+    if handler is None:
+        return
+    try:
+        handler(event)
+    except Exception:
+        logger.exception("Handler failed for %s event %s", event.type, event.id)
+
+
+def handle_pass_updated(event: CloudEvent):
+    """Handle PASS_UPDATED event"""
+    status = event.data.get("status")
+    user_id = event.data.get("userId")
+
+    if status == "COMPLETED":
+        # Provisioning successful!
+        # Update your database
+        # Notify the user
+        # Sync with access control system
+        logger.info("Pass provisioned for user %s", user_id)
+
+
+def handle_user_deleted(event: CloudEvent):
+    """Handle USER_DELETED event"""
+    # Cleanup local records
+    # Revoke physical access
+    pass
+
+
+# Event type -> handler; add entries here to handle other event types
+_HANDLERS = {
+    EventType.PASS_UPDATED.value: handle_pass_updated,
+    EventType.USER_DELETED.value: handle_user_deleted,
+}
+
+
+def start_log_listener(level: int = logging.INFO) -> QueueListener:
+    """
+    Route log records through a queue to a stdout handler
+
+    Handler threads then only enqueue records; formatting and writing to
+    stdout happen on the listener thread, so concurrent events do not
+    contend for the stream lock. Stop the returned listener at shutdown.
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+    listener.start()
+    return listener
+
+
+if __name__ == "__main__":
+    if not WEBHOOK_SECRET:
+        sys.exit("CALLBACK_SECRET is not set; refusing to start an unauthenticated webhook")
+    listener = start_log_listener()
+    try:
+        app.run(port=5000, debug=True)
+    finally:
+        listener.stop()
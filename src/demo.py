@@ -18,11 +18,15 @@ Part 4 - Callbacks:
 Run: python -m src.demo
 """
 
-import json
-from datetime import datetime
+import asyncio
+import logging
+import sys
+import uuid
+from typing import Awaitable, Callable, Iterable, List
 
 # Import our mock APIs (use real APIs in production)
 from .api.auth import MockOrigoAuth
+from .api.base import gather_bounded
 from .api.users import MockUserManagementAPI, User
 from .api.credentials import MockCredentialManagementAPI
 from .api.callbacks import (
@@ -30,21 +34,44 @@ from .api.callbacks import (
     CallbackRegistration,
     EventFilter,
     CloudEvent,
-    CallbackRecovery
+    CallbackRecovery,
+    EventDispatcher
 )
+from .utils.clock import iso_now
+from .utils.serialization import dumps_pretty
+
+
+# Most API calls in flight at once during an onboarding step
+ONBOARDING_CONCURRENCY = 50
+
+# Rules for section banners, step headers and the Step 4 callout
+_SECTION_RULE = "=" * 70
+_STEP_RULE = "-" * 50
+_BANNER = "=" * 60
+
+
+def in_threads(func: Callable, items: Iterable) -> Awaitable[list]:
+    """Run func(item) for every item in worker threads, ONBOARDING_CONCURRENCY at a time"""
+    return gather_bounded(lambda item: asyncio.to_thread(func, item), items, ONBOARDING_CONCURRENCY)
+
+
+def emit(*lines: str):
+    """Write lines to stdout with a single write call"""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_banner(text: str):
     """Print a section banner"""
-    width = 70
-    print("\n" + "=" * width)
-    print(f" {text}")
-    print("=" * width)
+    sys.stdout.write(f"\n{_SECTION_RULE}\n {text}\n{_SECTION_RULE}\n")
 
 
-def main():
+async def main(employees: List[User] = None):
+    # API clients report each step through logging; show it all on stdout
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    logging.getLogger(__package__).setLevel(logging.DEBUG)
+
     print_banner("HID ORIGO INTEGRATION - COMPLETE DEMO")
-    print("""
+    emit("""
     Scenario: ACME Corporate Mobile Badge Provisioning
 
     This demo simulates the complete flow of:
@@ -67,75 +94,125 @@ def main():
     # -------------------------------------------------------------------------
     # Step 1: Authentication
     # -------------------------------------------------------------------------
-    print("\n>>> STEP 1: OAuth2 Authentication")
-    print("-" * 50)
+    emit(
+        "\n>>> STEP 1: OAuth2 Authentication",
+        _STEP_RULE
+    )
 
-    auth = MockOrigoAuth(
+    # One pooled session (owned by auth) carries every API call below;
+    # leaving the block releases its connections
+    with MockOrigoAuth(
         organization_id="acme-corp-7521464",
         client_id="ACME-OSRV-12345678",
         client_secret="K5bkps7mtnq7VDQr_secret"
+    ) as auth:
+        # The clients block on I/O, so each call runs in a worker thread and
+        # independent calls can overlap on the event loop
+        await asyncio.to_thread(auth.authenticate)
+        # Renew the token in the background before it expires; stopped when
+        # the with block closes auth
+        auth.start_refresher()
+
+        emit(
+            "\n✓ Authentication complete. We now have a Bearer token for API calls.",
+            "  Token is valid for 3600 seconds (1 hour).",
+            "  All subsequent API calls will include: Authorization: Bearer <token>"
+        )
+
+        # ---------------------------------------------------------------------
+        # Step 2: Create User
+        # ---------------------------------------------------------------------
+        emit(
+            "\n>>> STEP 2: Create User (User Management API)",
+            _STEP_RULE
+        )
+
+        users_api = MockUserManagementAPI(auth)
+        callback_api = MockCallbackAPI(auth)
+
+        # Employees to onboard (one by default); each step runs for all of
+        # them concurrently, capped by ONBOARDING_CONCURRENCY
+        if employees is None:
+            employees = [User(
+                external_id="EMP-2025-001",           # ACME's internal employee ID
+                email="john.doe@acme.com",
+                display_name="John Doe",
+                given_name="John",
+                family_name="Doe"
+            )]
+
+        # Registering the webhook (Step 5) does not depend on Steps 2-4, so
+        # it runs in the background while they do
+        webhook_registration = CallbackRegistration(
+            url="https://api.acme.com/webhooks/hid-origo",
+            filter=EventFilter(event_types=[
+                "PASS_CREATED",
+                "PASS_UPDATED",
+                "PASS_DELETED",
+                "USER_DELETED"
+            ]),
+            http_header="Authorization",
+            secret="Bearer acme-webhook-secret-xyz"
+        )
+
+        registration_task = asyncio.create_task(
+            asyncio.to_thread(callback_api.register_callback, webhook_registration)
+        )
+
+        created_users = await in_threads(users_api.create_user, employees)
+        created_user = created_users[0]
+
+        emit(
+            f"\n✓ User created in HID Origo.",
+            f"  Now we have a user_id ({created_user.id}) to associate with a pass."
+        )
+
+        # ---------------------------------------------------------------------
+        # Step 3: Create Pass
+        # ---------------------------------------------------------------------
+        emit(
+            "\n>>> STEP 3: Create Pass (Credential Management API)",
+            _STEP_RULE
+        )
+
+        creds_api = MockCredentialManagementAPI(auth, verbose=True)
+
+        # Pass template would be pre-configured in HID Origo portal
+        # It defines: credential type (SEOS, iCLASS), artwork, platform settings
+        PASS_TEMPLATE_ID = "tmpl-acme-employee-badge-v1"
+
+        passes = await in_threads(
+            lambda user: creds_api.create_pass(user_id=user.id, pass_template_id=PASS_TEMPLATE_ID),
+            created_users
+        )
+        pass_obj = passes[0]
+
+        emit(
+            f"\n✓ Pass created with status: {pass_obj.status.value}",
+            f"  The pass is in PENDING state until provisioned to a wallet."
+        )
+
+        # ---------------------------------------------------------------------
+        # Step 4: Generate Issuance Token
+        # ---------------------------------------------------------------------
+        emit(
+            "\n>>> STEP 4: Generate Issuance Token",
+            _STEP_RULE
+        )
+
+        # The mock prints each token; in production they go to the phones
+        await in_threads(creds_api.get_issuance_token, [p.id for p in passes])
+
+        # Finish Step 5 before the shared session closes
+        await registration_task
+
+    emit(
+        "\n✓ Issuance token generated!",
+        "\n" + _BANNER,
+        "WHAT HAPPENS NEXT (in production):",
+        _BANNER
     )
-    auth.authenticate()
-
-    print("\n✓ Authentication complete. We now have a Bearer token for API calls.")
-    print("  Token is valid for 3600 seconds (1 hour).")
-    print("  All subsequent API calls will include: Authorization: Bearer <token>")
-
-    # -------------------------------------------------------------------------
-    # Step 2: Create User
-    # -------------------------------------------------------------------------
-    print("\n>>> STEP 2: Create User (User Management API)")
-    print("-" * 50)
-
-    users_api = MockUserManagementAPI(auth)
-
-    # Create an employee
-    employee = User(
-        external_id="EMP-2025-001",           # ACME's internal employee ID
-        email="john.doe@acme.com",
-        display_name="John Doe",
-        given_name="John",
-        family_name="Doe"
-    )
-
-    created_user = users_api.create_user(employee)
-
-    print(f"\n✓ User created in HID Origo.")
-    print(f"  Now we have a user_id ({created_user.id}) to associate with a pass.")
-
-    # -------------------------------------------------------------------------
-    # Step 3: Create Pass
-    # -------------------------------------------------------------------------
-    print("\n>>> STEP 3: Create Pass (Credential Management API)")
-    print("-" * 50)
-
-    creds_api = MockCredentialManagementAPI(auth)
-
-    # Pass template would be pre-configured in HID Origo portal
-    # It defines: credential type (SEOS, iCLASS), artwork, platform settings
-    PASS_TEMPLATE_ID = "tmpl-acme-employee-badge-v1"
-
-    pass_obj = creds_api.create_pass(
-        user_id=created_user.id,
-        pass_template_id=PASS_TEMPLATE_ID
-    )
-
-    print(f"\n✓ Pass created with status: {pass_obj.status.value}")
-    print(f"  The pass is in PENDING state until provisioned to a wallet.")
-
-    # -------------------------------------------------------------------------
-    # Step 4: Generate Issuance Token
-    # -------------------------------------------------------------------------
-    print("\n>>> STEP 4: Generate Issuance Token")
-    print("-" * 50)
-
-    issuance_token = creds_api.get_issuance_token(pass_obj.id)
-
-    print("\n✓ Issuance token generated!")
-    print("\n" + "="*60)
-    print("WHAT HAPPENS NEXT (in production):")
-    print("="*60)
-    print("""
+    emit("""
     1. Send token to employee's phone via:
        - Push notification (recommended)
        - QR code displayed on enrollment kiosk
@@ -169,41 +246,33 @@ def main():
     # -------------------------------------------------------------------------
     # Step 5: Register Callback
     # -------------------------------------------------------------------------
-    print("\n>>> STEP 5: Register Webhook Callback")
-    print("-" * 50)
-
-    callback_api = MockCallbackAPI(auth)
-
-    # Create a callback registration with event filter
-    webhook_registration = CallbackRegistration(
-        url="https://api.acme.com/webhooks/hid-origo",
-        filter=EventFilter(event_types=[
-            "PASS_CREATED",
-            "PASS_UPDATED",
-            "PASS_DELETED",
-            "USER_DELETED"
-        ]),
-        http_header="Authorization",
-        secret="Bearer acme-webhook-secret-xyz"
+    emit(
+        "\n>>> STEP 5: Register Webhook Callback",
+        _STEP_RULE
     )
 
-    callback_api.register_callback(webhook_registration)
+    # Registered in the background during Steps 2-4 (see Step 2)
 
-    print("\n✓ Webhook registered!")
-    print("  HID Origo will now POST events to: https://api.acme.com/webhooks/hid-origo")
-    print("  Events will be filtered to only: PASS_*, USER_DELETED")
+    emit(
+        "\n✓ Webhook registered!",
+        "  HID Origo will now POST events to: https://api.acme.com/webhooks/hid-origo",
+        "  Events will be filtered to only: PASS_*, USER_DELETED"
+    )
 
     # -------------------------------------------------------------------------
     # Step 6: Event Handling Example
     # -------------------------------------------------------------------------
-    print("\n>>> STEP 6: Event Handling Example")
-    print("-" * 50)
+    emit(
+        "\n>>> STEP 6: Event Handling Example",
+        _STEP_RULE
+    )
 
     # Simulate receiving an event
     example_event_payload = {
+        "id": str(uuid.uuid4()),
         "type": "PASS_UPDATED",
         "subject": f"pass/{pass_obj.id}",
-        "time": datetime.utcnow().isoformat() + "Z",
+        "time": iso_now(),
         "data": {
             "status": "COMPLETED",
             "userId": created_user.id,
@@ -211,13 +280,25 @@ def main():
         }
     }
 
-    print("\nSimulated incoming webhook event:")
-    print(json.dumps(example_event_payload, indent=2))
+    emit(
+        "\nSimulated incoming webhook event:",
+        dumps_pretty(example_event_payload)
+    )
+
+    # The webhook only queues the payload; a worker parses and interprets it
+    def show_interpretation(event: CloudEvent):
+        emit(
+            "\nEvent interpretation:",
+            event.interpret()
+        )
+
+    async with EventDispatcher(show_interpretation, workers=2) as dispatcher:
+        await dispatcher.submit(example_event_payload)
+        await dispatcher.join()
 
-    # Parse and interpret
-    event = CloudEvent.from_dict(example_event_payload)
-    print("\nEvent interpretation:")
-    print(event.interpret())
+        # Origo may redeliver an event; the repeat is dropped before parsing
+        if not await dispatcher.submit(example_event_payload):
+            emit("\nRedelivered event: already processed, skipped.")
 
     # =========================================================================
     # Summary
@@ -225,7 +306,7 @@ def main():
 
     print_banner("EXERCISE COMPLETE - SUMMARY")
 
-    print("""
+    emit("""
     PART 2 - API Exercise (Completed):
     ──────────────────────────────────
     ✓ Step 1: OAuth2 authentication - obtained Bearer token
@@ -258,4 +339,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""
+In-process caching helpers for HID Origo Integration
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterator, List, Tuple
+
+# Default bound on cached GET-by-id results per API client
+READ_CACHE_SIZE = 10_000
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after `ttl` seconds
+
+    Thread-safe: API clients are shared between worker threads.
+    Expiry uses the monotonic clock, so wall-clock changes do not
+    extend or cut short an entry's lifetime.
+
+    Usage:
+        cache = TTLCache(maxsize=10_000, ttl=30)
+        cache.set(pass_id, pass_obj)
+        pass_obj = cache.get(pass_id)   # None once expired or evicted
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for key, or default"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store value under key, evicting the least recently used entry if full"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (expired or not), or default"""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Snapshot of the live (key, value) pairs, least recently used first"""
+        now = time.monotonic()
+        with self._lock:
+            return [(key, value) for key, (expires_at, value) in self._data.items() if expires_at > now]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self.items())
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter([key for key, _ in self.items()])
+
+
+_MISSING = object()
@@ -0,0 +1,26 @@
+"""
+Timestamp helpers for HID Origo Integration
+"""
+import time
+
+# (whole second, "YYYY-MM-DDTHH:MM:SS" for that second) of the last call;
+# one tuple so concurrent callers never see a mismatched pair
+_last_second = (None, "")
+
+
+def iso_now() -> str:
+    """
+    Current UTC time as an ISO 8601 string with microseconds and "Z"
+
+    Same format as datetime.utcnow().isoformat() + "Z" (whenever the
+    microseconds are non-zero), without creating a datetime. The
+    date-and-time prefix is formatted once per second and reused.
+    """
+    global _last_second
+    now = time.time()
+    second = int(now)
+    cached = _last_second
+    if cached[0] != second:
+        cached = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+        _last_second = cached
+    return f"{cached[1]}.{int((now - second) * 1_000_000):06d}Z"
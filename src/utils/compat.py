@@ -0,0 +1,7 @@
+"""
+Python version compatibility helpers
+"""
+import sys
+
+# Keyword arguments for @dataclass that add __slots__ where supported (3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
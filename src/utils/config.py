@@ -2,43 +2,71 @@
 Configuration management for HID Origo Integration
 """
 import os
-from dataclasses import dataclass
-from dotenv import load_dotenv
+from dataclasses import dataclass, field
 
-load_dotenv()
+from .compat import DATACLASS_SLOTS
 
+# Deployments that inject the environment directly (containers, systemd)
+# can set ORIGO_USE_DOTENV=0 to skip importing dotenv and searching for .env
+if os.getenv("ORIGO_USE_DOTENV", "1").lower() not in ("0", "false", "no"):
+    from dotenv import load_dotenv
 
-@dataclass
+    load_dotenv()
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class OrigoConfig:
-    """HID Origo API Configuration"""
+    """
+    HID Origo API Configuration
+
+    Immutable (and hashable), so one instance can be shared freely, e.g.
+    one per organization in a multi-tenant setup. Use
+    dataclasses.replace() to derive a modified copy.
+    """
     base_url: str = os.getenv("ORIGO_BASE_URL", "https://api.origo.hidglobal.com")
     organization_id: str = os.getenv("ORIGO_ORGANIZATION_ID", "")
     client_id: str = os.getenv("ORIGO_CLIENT_ID", "")
     client_secret: str = os.getenv("ORIGO_CLIENT_SECRET", "")
 
+    # Seconds before expiry at which a token is treated as expired, to cover
+    # round-trip and server-side validation latency
+    token_buffer_seconds: int = int(os.getenv("ORIGO_TOKEN_BUFFER", "60"))
+
+    # Seconds a GET-by-id result (user, pass) is served from the client-side
+    # cache; 0 disables it. Writes through the same client invalidate it.
+    read_cache_ttl: float = float(os.getenv("ORIGO_READ_CACHE_TTL", "30"))
+
+    # Seconds get_or_create_user() trusts a cached externalId -> user mapping
+    external_id_cache_ttl: float = float(os.getenv("ORIGO_EXTERNAL_ID_CACHE_TTL", "600"))
+
+    # Simulated network latency for the Mock* clients, in milliseconds
+    mock_latency_ms: int = int(os.getenv("MOCK_LATENCY_MS", "0"))
+    # Have the mocks print explanatory walkthroughs (e.g. issuance token usage)
+    verbose_mock: bool = os.getenv("ORIGO_VERBOSE_MOCK", "0").lower() in ("1", "true", "yes")
+
     # Callback settings
     callback_url: str = os.getenv("CALLBACK_URL", "")
     callback_secret: str = os.getenv("CALLBACK_SECRET", "")
 
-    @property
-    def auth_endpoint(self) -> str:
-        """OAuth2 token endpoint"""
-        return f"{self.base_url}/authentication/customer/{self.organization_id}/token"
-
-    @property
-    def user_endpoint(self) -> str:
-        """User management base endpoint"""
-        return f"{self.base_url}/user"
-
-    @property
-    def pass_endpoint(self) -> str:
-        """Credential management (pass) base endpoint"""
-        return f"{self.base_url}/pass"
-
-    @property
-    def callback_endpoint(self) -> str:
-        """Callback registration endpoint"""
-        return f"{self.base_url}/callback"
+    # base_url without a trailing slash, computed once for API clients
+    base_url_normalized: str = field(init=False, repr=False)
+
+    # Endpoint URLs, built once from base_url and organization_id
+    auth_endpoint: str = field(init=False, repr=False)        # OAuth2 token endpoint
+    user_endpoint: str = field(init=False, repr=False)        # User management base endpoint
+    pass_endpoint: str = field(init=False, repr=False)        # Credential management (pass) base endpoint
+    callback_endpoint: str = field(init=False, repr=False)    # Callback registration endpoint
+
+    def __post_init__(self):
+        # Frozen: derived fields are set through object.__setattr__
+        base_url = self.base_url.rstrip("/")
+        object.__setattr__(self, "base_url_normalized", base_url)
+        object.__setattr__(
+            self, "auth_endpoint", f"{base_url}/authentication/customer/{self.organization_id}/token"
+        )
+        object.__setattr__(self, "user_endpoint", f"{base_url}/user")
+        object.__setattr__(self, "pass_endpoint", f"{base_url}/pass")
+        object.__setattr__(self, "callback_endpoint", f"{base_url}/callback")
 
 
 # Global config instance
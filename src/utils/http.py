@@ -0,0 +1,123 @@
+"""
+HTTP transport helpers for HID Origo Integration
+"""
+import ssl
+import uuid
+from typing import Dict, Mapping
+
+import certifi
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
+
+
+def _session_ssl_context() -> ssl.SSLContext:
+    """urllib3-style verifying context with the certifi bundle loaded"""
+    context = create_urllib3_context()
+    context.load_verify_locations(cafile=certifi.where())
+    return context
+
+
+# The CA bundle is parsed once here rather than for each new pooled
+# connection. Each client library gets its own context because both set
+# ALPN on the context they are given.
+_SESSION_SSL_CONTEXT = _session_ssl_context()
+_ASYNC_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
+
+class _PreloadedSSLAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose default-verified connections share _SESSION_SSL_CONTEXT
+
+    Only requests with verify=True and no client certificate use the shared
+    context, and their connections are not given a CA path, so urllib3
+    never reloads the bundle into it. A custom CA bundle, verify=False or a
+    client certificate gets urllib3's usual per-connection context instead,
+    so those settings never leak into the shared one.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("ssl_context", _SESSION_SSL_CONTEXT)
+        return super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs.setdefault("ssl_context", _SESSION_SSL_CONTEXT)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert
+        )
+        if verify is not True or cert:
+            pool_kwargs["ssl_context"] = None
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if verify is True and not cert:
+            # The shared context already holds the bundle
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+
+def build_session() -> requests.Session:
+    """
+    Build a pooled requests.Session for the HID Origo API
+
+    Reusing one session keeps connections to the Origo host alive, so
+    only the first call pays for the TCP and TLS handshakes.
+
+    Rate limiting (429) and transient gateway errors are retried inside
+    urllib3 with jittered exponential backoff, honoring Retry-After, so
+    clients sharing a client_id do not retry in lockstep. POSTs are only
+    retried safely because the API clients send them with an
+    Idempotency-Key (see with_idempotency_key).
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        backoff_jitter=0.5,
+        status_forcelist=(429, 502, 503, 504),
+        respect_retry_after_header=True,
+        allowed_methods=frozenset(["GET", "POST", "PATCH", "DELETE"]),
+        # Hand the last response back so raise_for_status reports it as usual
+        raise_on_status=False
+    )
+    # One host, so few pools; pool_maxsize bounds concurrent threaded requests
+    adapter = _PreloadedSSLAdapter(pool_connections=4, pool_maxsize=64, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+def with_idempotency_key(headers: Mapping[str, str]) -> Dict[str, str]:
+    """
+    Copy of headers with a fresh Idempotency-Key for one create request
+
+    Retries of the same request reuse its headers, so the server can
+    recognize a replayed POST instead of creating a duplicate.
+    """
+    return {**headers, "Idempotency-Key": str(uuid.uuid4())}
+
+
+# Connection cap of build_async_client(); the async API clients also keep
+# at most this many requests in flight per bulk call
+ASYNC_MAX_CONNECTIONS = 20
+
+
+def build_async_client() -> httpx.AsyncClient:
+    """
+    Build an HTTP/2 httpx.AsyncClient for concurrent Origo API calls
+
+    HTTP/2 multiplexes concurrent requests over a single connection, so a
+    fan-out of N calls costs one handshake instead of N.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        verify=_ASYNC_SSL_CONTEXT,
+        limits=httpx.Limits(max_connections=ASYNC_MAX_CONNECTIONS, max_keepalive_connections=10),
+        timeout=30
+    )
@@ -0,0 +1,38 @@
+"""
+JSON serialization for HID Origo Integration
+
+Uses orjson or msgspec when one is installed and falls back to the
+standard library. dumps() always returns bytes so request bodies can be
+sent as-is; dumps_pretty() returns 2-space indented text for logs and
+console output.
+"""
+try:
+    import orjson
+
+    dumps = orjson.dumps
+    loads = orjson.loads
+
+    def dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    try:
+        import msgspec
+
+        _encoder = msgspec.json.Encoder()
+        _decoder = msgspec.json.Decoder()
+
+        dumps = _encoder.encode
+        loads = _decoder.decode
+
+        def dumps_pretty(obj) -> str:
+            return msgspec.json.format(_encoder.encode(obj), indent=2).decode()
+    except ImportError:
+        import json
+
+        def dumps(obj) -> bytes:
+            return json.dumps(obj, separators=(",", ":")).encode()
+
+        def dumps_pretty(obj) -> str:
+            return json.dumps(obj, indent=2, ensure_ascii=False)
+
+        loads = json.loads
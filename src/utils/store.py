@@ -0,0 +1,68 @@
+"""
+In-memory storage for the mock API clients
+"""
+import threading
+from typing import Any, Hashable, Iterator, List
+
+
+class ShardedStore:
+    """
+    Thread-safe dict split into independently locked shards
+
+    Load simulations drive the mock clients from thread pools; spreading
+    keys over `shards` dicts means threads touching different ids rarely
+    wait on the same lock. Supports the dict operations the mocks use.
+    """
+
+    def __init__(self, shards: int = 16):
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError(f"shards must be a power of two: {shards}")
+        self._mask = shards - 1
+        self._shards = [{} for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    def _index(self, key: Hashable) -> int:
+        return hash(key) & self._mask
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        # Single dict lookups are atomic, so reads skip the lock
+        return self._shards[self._index(key)].get(key, default)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        i = self._index(key)
+        with self._locks[i]:
+            return self._shards[i].pop(key, default)
+
+    def __setitem__(self, key: Hashable, value: Any):
+        i = self._index(key)
+        with self._locks[i]:
+            self._shards[i][key] = value
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return self._shards[self._index(key)][key]
+
+    def __delitem__(self, key: Hashable):
+        i = self._index(key)
+        with self._locks[i]:
+            del self._shards[i][key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._shards[self._index(key)]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def values(self) -> List[Any]:
+        """Snapshot of all stored values"""
+        result = []
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                result.extend(shard.values())
+        return result
+
+    def __iter__(self) -> Iterator[Hashable]:
+        keys = []
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                keys.extend(shard)
+        return iter(keys)
@@ -0,0 +1,17 @@
+"""Shared pytest fixtures"""
+import time
+
+import pytest
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Frozen time.monotonic(); advance it with clock[0] += seconds
+
+    Replaces the function process-wide, so do not combine it with asyncio
+    timers (sleep, wait_for), which read the same clock.
+    """
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
@@ -0,0 +1,75 @@
+"""Tests for token expiry handling and the background refresher"""
+import asyncio
+import time
+
+import pytest
+
+from src.api import auth as auth_module
+from src.api.auth import MAX_TOKEN_BUFFER_SECONDS, MockOrigoAuth, TokenResponse
+
+
+def test_token_buffer_is_clamped():
+    assert MockOrigoAuth(token_buffer_seconds=3580).token_buffer_seconds == MAX_TOKEN_BUFFER_SECONDS
+    assert MockOrigoAuth(token_buffer_seconds=-5).token_buffer_seconds == 0
+
+
+def test_token_without_timestamp_is_expired():
+    assert TokenResponse("t", "Bearer", 3600).is_expired()
+    assert not TokenResponse("t", "Bearer", 3600, obtained_at=time.monotonic()).is_expired()
+
+
+def test_token_expiry_follows_monotonic_clock(clock):
+    token = TokenResponse("t", "Bearer", 3600, obtained_at=time.monotonic())
+    clock[0] += 3600 - 61
+    assert not token.is_expired(buffer_seconds=60)
+    clock[0] += 1
+    assert token.is_expired(buffer_seconds=60)
+
+
+@pytest.mark.parametrize("expires_in", [3600, 20])
+def test_refresher_does_not_spin(monkeypatch, expires_in):
+    monkeypatch.setattr(auth_module, "REFRESH_RETRY_SECONDS", 0.05)
+    auth = MockOrigoAuth(token_buffer_seconds=3580)
+    calls = []
+
+    def authenticate():
+        calls.append(time.monotonic())
+        auth._token = TokenResponse("t", "Bearer", expires_in, obtained_at=time.monotonic())
+        return auth._token
+
+    monkeypatch.setattr(auth, "authenticate", authenticate)
+    authenticate()
+
+    async def scenario():
+        auth.start_refresher()
+        await asyncio.sleep(0.3)
+        auth.stop_refresher()
+
+    asyncio.run(scenario())
+    auth.close()
+    # Only the initial token: both lifetimes far exceed the test duration
+    assert len(calls) == 1
+
+
+def test_refresher_retries_overdue_token_after_a_pause(monkeypatch):
+    monkeypatch.setattr(auth_module, "REFRESH_RETRY_SECONDS", 0.1)
+    auth = MockOrigoAuth()
+    calls = []
+
+    def authenticate():
+        calls.append(time.monotonic())
+        # Already past its refresh point when issued
+        auth._token = TokenResponse("t", "Bearer", 60, obtained_at=time.monotonic() - 60)
+        return auth._token
+
+    monkeypatch.setattr(auth, "authenticate", authenticate)
+    authenticate()
+
+    async def scenario():
+        auth.start_refresher()
+        await asyncio.sleep(0.35)
+        auth.stop_refresher()
+
+    asyncio.run(scenario())
+    auth.close()
+    assert 2 <= len(calls) <= 5
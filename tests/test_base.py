@@ -0,0 +1,21 @@
+"""Tests for the shared API client plumbing"""
+import asyncio
+
+from src.api.base import gather_bounded
+
+
+def test_gather_bounded_keeps_order_and_limit():
+    in_flight = [0]
+    peak = [0]
+
+    async def work(item):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.001 * (item % 3))
+        in_flight[0] -= 1
+        return item * 2
+
+    results = asyncio.run(gather_bounded(work, range(50), limit=5))
+
+    assert results == [item * 2 for item in range(50)]
+    assert peak[0] == 5
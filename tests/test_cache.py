@@ -0,0 +1,56 @@
+"""Tests for the in-memory cache and store helpers"""
+import threading
+
+import pytest
+
+from src.utils.cache import TTLCache
+from src.utils.store import ShardedStore
+
+
+def test_ttl_cache_expires_entries(clock):
+    cache = TTLCache(maxsize=10, ttl=5)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    clock[0] += 5
+    assert cache.get("a") is None
+    assert "a" not in cache
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert sorted(cache) == ["a", "c"]
+
+
+def test_ttl_cache_pop_returns_default_when_missing():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "gone") == "gone"
+
+
+def test_sharded_store_rejects_non_power_of_two():
+    with pytest.raises(ValueError):
+        ShardedStore(shards=3)
+
+
+def test_sharded_store_concurrent_writes():
+    store = ShardedStore()
+
+    def write(start):
+        for i in range(start, start + 1000):
+            store[i] = i
+
+    threads = [threading.Thread(target=write, args=(n * 1000,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store) == 8000
+    assert store.get(4321) == 4321
+    del store[4321]
+    assert 4321 not in store
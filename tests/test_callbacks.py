@@ -0,0 +1,297 @@
+"""Tests for CloudEvent parsing, event dispatch and the circuit breaker"""
+import asyncio
+
+import httpx
+import pytest
+import requests
+
+from src.api.auth import MockOrigoAuth
+from src.api.callbacks import (
+    CIRCUIT_WINDOW,
+    CallbackAPI,
+    CallbackRegistration,
+    CircuitOpenError,
+    CircuitState,
+    CloudEvent,
+    EndpointHealth,
+    EventDispatcher,
+    EventFilter,
+    is_endpoint_failure,
+)
+
+
+def _payload(event_id, subject="pass/1"):
+    return {"id": event_id, "type": "PASS_UPDATED", "subject": subject}
+
+
+def test_from_batch_skips_malformed_items():
+    events = CloudEvent.from_batch([
+        {"id": "a", "type": "PASS_UPDATED", "subject": "pass/1"},
+        {"id": "b", "type": "PASS_UPDATED", "time": "not a time"},
+        "not an object",
+        {"id": "c", "type": "USER_DELETED", "time": "2025-11-10T14:05:00Z", "data": []},
+    ])
+
+    assert [event.id for event in events] == ["a", "c"]
+    assert events[0].time is None and events[0].data == {}
+    assert events[1].data == []
+
+
+def test_dispatcher_handles_sync_and_async_handlers():
+    handled = []
+
+    async def async_handler(event):
+        await asyncio.sleep(0)
+        handled.append(("async", event.id))
+
+    async def scenario():
+        async with EventDispatcher(lambda event: handled.append(("sync", event.id))) as dispatcher:
+            await dispatcher.submit(_payload("a"))
+        async with EventDispatcher(async_handler, workers=2) as dispatcher:
+            await dispatcher.submit(_payload("b"))
+
+    asyncio.run(scenario())
+    assert handled == [("sync", "a"), ("async", "b")]
+
+
+def test_submit_nowait_drops_when_full():
+    async def scenario():
+        dispatcher = EventDispatcher(workers=1, maxsize=1)
+        await dispatcher.start()
+        # Workers have not run yet, so the queue holds one event at most
+        results = [dispatcher.submit_nowait(_payload(str(i))) for i in range(3)]
+        await dispatcher.aclose()
+        return results
+
+    assert asyncio.run(scenario()) == [True, False, False]
+
+
+def test_duplicate_event_is_not_queued_again():
+    handled = []
+
+    async def scenario():
+        async with EventDispatcher(lambda event: handled.append(event.id)) as dispatcher:
+            assert await dispatcher.submit(_payload("a"))
+            await dispatcher.join()
+            assert not await dispatcher.submit(_payload("a"))
+            assert await dispatcher.submit(_payload("a", subject="pass/2"))
+
+    asyncio.run(scenario())
+    assert handled == ["a", "a"]
+
+
+def test_concurrent_redeliveries_on_full_queue_are_deduplicated():
+    handled = []
+
+    async def handler(event):
+        await asyncio.sleep(0.01)
+        handled.append(event.id)
+
+    async def scenario():
+        async with EventDispatcher(handler, workers=1, maxsize=1) as dispatcher:
+            await dispatcher.submit(_payload("first"))
+            await dispatcher.submit(_payload("second"))
+            return await asyncio.gather(
+                dispatcher.submit(_payload("dup")), dispatcher.submit(_payload("dup"))
+            )
+
+    assert sorted(asyncio.run(scenario())) == [False, True]
+    assert handled.count("dup") == 1
+
+
+def test_cancelled_submit_releases_dedupe_key():
+    async def handler(event):
+        await asyncio.sleep(0.05)
+
+    async def scenario():
+        async with EventDispatcher(handler, workers=1, maxsize=1) as dispatcher:
+            await dispatcher.submit(_payload("first"))
+            await dispatcher.submit(_payload("second"))
+            try:
+                await asyncio.wait_for(dispatcher.submit(_payload("late")), 0.001)
+            except asyncio.TimeoutError:
+                pass
+            return await dispatcher.submit(_payload("late"))
+
+    assert asyncio.run(scenario())
+
+
+def test_failed_handler_allows_redelivery():
+    attempts = []
+
+    def handler(event):
+        attempts.append(event.id)
+        if len(attempts) == 1:
+            raise RuntimeError("downstream unavailable")
+
+    async def scenario():
+        async with EventDispatcher(handler) as dispatcher:
+            await dispatcher.submit(_payload("a"))
+            await dispatcher.join()
+            assert await dispatcher.submit(_payload("a"))
+
+    asyncio.run(scenario())
+    assert attempts == ["a", "a"]
+
+
+def _fail(health):
+    with pytest.raises(requests.ConnectionError):
+        with health.track():
+            raise requests.ConnectionError("endpoint down")
+
+
+def _succeed(health):
+    with health.track():
+        pass
+
+
+def test_opens_only_after_a_full_window_of_failures(clock):
+    health = EndpointHealth("https://example.com/hook", window=4)
+    for _ in range(3):
+        _fail(health)
+    assert health.state is CircuitState.CLOSED
+
+    _fail(health)
+    assert health.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        health.check()
+
+
+def test_failure_ratio_at_threshold_stays_closed(clock):
+    health = EndpointHealth("https://example.com/hook", window=4)
+    _succeed(health)
+    _fail(health)
+    _succeed(health)
+    _fail(health)
+    assert health.state is CircuitState.CLOSED
+
+
+def test_half_open_probe_closes_or_reopens(clock):
+    health = EndpointHealth("https://example.com/hook", window=2, reset_after=30)
+    _fail(health)
+    _fail(health)
+    assert health.state is CircuitState.OPEN
+
+    clock[0] += 30
+    _fail(health)
+    assert health.state is CircuitState.OPEN
+
+    clock[0] += 30
+    health.check()
+    assert health.state is CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        health.check()
+    health.record_success(0.1)
+    assert health.state is CircuitState.CLOSED
+
+
+def test_cancelled_probe_reopens_circuit():
+    # Real clock: asyncio's timers run on time.monotonic too
+    health = EndpointHealth("https://example.com/hook", window=2, reset_after=0)
+    _fail(health)
+    _fail(health)
+
+    async def probe():
+        with health.track():
+            assert health.state is CircuitState.HALF_OPEN
+            await asyncio.sleep(1)
+
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(probe(), 0.01)
+
+    asyncio.run(scenario())
+    assert health.state is CircuitState.OPEN
+    health.check()
+    assert health.state is CircuitState.HALF_OPEN
+
+
+def _http_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} error", response=response)
+
+
+@pytest.mark.parametrize("exc, failure", [
+    (_http_error(400), False),
+    (_http_error(409), False),
+    (_http_error(429), True),
+    (_http_error(503), True),
+    (requests.ConnectTimeout("timed out"), True),
+    (httpx.ConnectError("refused"), True),
+    (httpx.HTTPStatusError(
+        "conflict", request=httpx.Request("POST", "https://example.com"),
+        response=httpx.Response(409)
+    ), False),
+    (ValueError("bad input"), False),
+    (asyncio.CancelledError(), True),
+])
+def test_is_endpoint_failure(exc, failure):
+    assert is_endpoint_failure(exc) is failure
+
+
+def test_rejected_probe_closes_circuit(clock):
+    health = EndpointHealth("https://example.com/hook", window=2, reset_after=30)
+    _fail(health)
+    _fail(health)
+    clock[0] += 30
+
+    with pytest.raises(requests.HTTPError):
+        with health.track():
+            raise _http_error(404)
+    assert health.state is CircuitState.CLOSED
+
+
+class _StatusSession:
+    """Answers every request with one status code"""
+
+    def __init__(self, status: int):
+        self.status = status
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = self.status
+        response.url = url
+        response._content = b'{"id": "cb-1"}' if self.status < 400 else b""
+        return response
+
+
+def _registration(url="https://api.acme.com/webhooks/hid-origo"):
+    return CallbackRegistration(url=url, filter=EventFilter(event_types=["PASS_UPDATED"]))
+
+
+def _callback_api(session):
+    return CallbackAPI(MockOrigoAuth(), base_url="https://api.origo.hidglobal.com", session=session)
+
+
+def test_invalid_registrations_do_not_open_circuit():
+    session = _StatusSession(201)
+    api = _callback_api(session)
+    for _ in range(CIRCUIT_WINDOW):
+        with pytest.raises(ValueError):
+            api.register_callback(_registration(url="http://bad"))
+
+    assert session.calls == 0
+    assert api.register_callback(_registration()).id == "cb-1"
+
+
+def test_rejected_registrations_do_not_open_circuit():
+    api = _callback_api(_StatusSession(409))
+    for _ in range(CIRCUIT_WINDOW):
+        with pytest.raises(requests.HTTPError):
+            api.register_callback(_registration())
+    assert api.health.state is CircuitState.CLOSED
+
+
+def test_server_errors_open_circuit():
+    session = _StatusSession(503)
+    api = _callback_api(session)
+    for _ in range(CIRCUIT_WINDOW):
+        with pytest.raises(requests.HTTPError):
+            api.register_callback(_registration())
+
+    with pytest.raises(CircuitOpenError):
+        api.register_callback(_registration())
+    assert session.calls == CIRCUIT_WINDOW
@@ -0,0 +1,19 @@
+"""Tests for the timestamp helpers"""
+import re
+from datetime import datetime, timedelta, timezone
+
+from src.utils.clock import iso_now
+
+ISO_FORMAT = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z$")
+
+
+def test_iso_now_matches_utc_isoformat():
+    stamp = iso_now()
+    assert ISO_FORMAT.match(stamp)
+    parsed = datetime.strptime(stamp, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
+    assert abs(datetime.now(timezone.utc) - parsed) < timedelta(seconds=5)
+
+
+def test_iso_now_is_monotonic_within_a_second():
+    stamps = [iso_now() for _ in range(1000)]
+    assert stamps == sorted(stamps)
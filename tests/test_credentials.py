@@ -0,0 +1,78 @@
+"""Tests for CredentialManagementAPI pagination"""
+import io
+
+import pytest
+
+from src.api import credentials
+from src.api.auth import MockOrigoAuth
+from src.api.credentials import CredentialManagementAPI
+from src.utils.serialization import dumps
+
+TOTAL_PASSES = 5
+SERVER_PAGE_LIMIT = 2
+
+
+class _Response:
+    def __init__(self, body: bytes):
+        self.content = body
+        self.raw = io.BytesIO(body)
+
+    def raise_for_status(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+class _CappedPagesSession:
+    """
+    Serves TOTAL_PASSES passes, never more than SERVER_PAGE_LIMIT per page
+
+    With `clamp`, a startIndex past the end returns the last page again
+    instead of an empty one.
+    """
+
+    def __init__(self, clamp: bool = False):
+        self.clamp = clamp
+        self.requests = []
+
+    def get(self, url, params, **kwargs):
+        self.requests.append(params)
+        start = params["startIndex"]
+        if self.clamp:
+            start = min(start, TOTAL_PASSES)
+        count = min(params["count"], SERVER_PAGE_LIMIT)
+        ids = range(start, min(start + count, TOTAL_PASSES + 1))
+        return _Response(dumps({
+            "schemas": ["urn:ietf:params:scim:api:messages:2.0:ListResponse"],
+            "Resources": [
+                {"id": f"pass-{i}", "userId": "usr-1", "credentials": [{"id": f"cred-{i}"}]}
+                for i in ids
+            ],
+            "totalResults": TOTAL_PASSES
+        }))
+
+
+@pytest.fixture(params=["streamed", "buffered"])
+def parser(request, monkeypatch):
+    if request.param == "buffered":
+        monkeypatch.setattr(credentials, "ijson", None)
+    elif credentials.ijson is None:
+        pytest.skip("ijson not installed")
+    return request.param
+
+
+@pytest.mark.parametrize("clamp", [False, True])
+def test_iter_passes_follows_short_pages(parser, clamp):
+    session = _CappedPagesSession(clamp=clamp)
+    api = CredentialManagementAPI(MockOrigoAuth(), session=session)
+
+    passes = list(api.iter_passes(page_size=100))
+
+    assert [p.id for p in passes] == [f"pass-{i}" for i in range(1, TOTAL_PASSES + 1)]
+    assert passes[0].credentials == [{"id": "cred-1"}]
+    # totalResults ends the listing without asking for an empty page
+    assert [r["startIndex"] for r in session.requests] == [1, 3, 5]
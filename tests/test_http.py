@@ -0,0 +1,24 @@
+"""Tests for the shared HTTP session setup"""
+from src.utils.http import build_session, with_idempotency_key
+
+
+def test_session_retries_rate_limits_and_gateway_errors():
+    session = build_session()
+    retry = session.get_adapter("https://api.origo.hidglobal.com").max_retries
+
+    assert retry.total == 5
+    assert {429, 502, 503, 504} <= set(retry.status_forcelist)
+    assert "POST" in retry.allowed_methods
+    assert retry.respect_retry_after_header
+    assert not retry.raise_on_status
+    session.close()
+
+
+def test_with_idempotency_key_copies_headers():
+    headers = {"Authorization": "Bearer t"}
+    first = with_idempotency_key(headers)
+    second = with_idempotency_key(headers)
+
+    assert "Idempotency-Key" not in headers
+    assert first["Authorization"] == "Bearer t"
+    assert first["Idempotency-Key"] != second["Idempotency-Key"]
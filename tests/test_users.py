@@ -0,0 +1,44 @@
+"""Tests for the User model and UserManagementAPI"""
+from src.api.users import MockUserManagementAPI, User
+from src.utils.serialization import loads
+
+
+def test_to_scim_dict_returns_a_fresh_dict():
+    user = User(external_id="E-1", email="e1@example.com", given_name="Ada", family_name="Lovelace")
+    body = user.to_scim_dict()
+    body["schemas"].append("urn:example:extension")
+    body["emails"][0]["value"] = "changed@example.com"
+
+    again = user.to_scim_dict()
+    assert again == loads(user.to_scim_json())
+    assert again["schemas"] == ["urn:ietf:params:scim:schemas:core:2.0:User"]
+    assert again["emails"][0]["value"] == "e1@example.com"
+    assert again["displayName"] == "Ada Lovelace"
+
+
+def test_to_scim_json_tracks_field_changes():
+    user = User(external_id="E-1", email="e1@example.com")
+    first = user.to_scim_json()
+    assert user.to_scim_json() is first
+
+    user.email = "new@example.com"
+    assert loads(user.to_scim_json())["emails"][0]["value"] == "new@example.com"
+
+
+def test_get_or_create_user_reuses_cached_mapping():
+    api = MockUserManagementAPI()
+    first = api.get_or_create_user(User(external_id="E-1", email="e1@example.com"))
+    again = api.get_or_create_user(User(external_id="E-1", email="e1@example.com"))
+    assert again is first
+
+
+def test_delete_user_forgets_external_id_mapping():
+    api = MockUserManagementAPI()
+    user = api.get_or_create_user(User(external_id="E-1", email="e1@example.com"))
+    other = api.get_or_create_user(User(external_id="E-2", email="e2@example.com"))
+
+    api.delete_user(user.id)
+
+    recreated = api.get_or_create_user(User(external_id="E-1", email="e1@example.com"))
+    assert recreated.id != user.id
+    assert api.get_or_create_user(User(external_id="E-2", email="e2@example.com")) is other
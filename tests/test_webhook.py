@@ -0,0 +1,94 @@
+"""Tests for the Flask webhook receiver"""
+import pytest
+
+from src.api import webhook
+
+SECRET = "test-secret"
+AUTH = {"Authorization": f"Bearer {SECRET}"}
+
+BATCH = (
+    b'[{"id": "no-time", "type": "PASS_UPDATED", "subject": "pass/1", "data": {}},'
+    b' {"id": "bad-time", "type": "PASS_UPDATED", "time": "yesterday"},'
+    b' 42,'
+    b' {"id": "ok", "type": "USER_DELETED", "subject": "user/1",'
+    b'  "time": "2025-11-10T14:05:00Z"}]'
+)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(webhook, "WEBHOOK_SECRET", SECRET)
+    monkeypatch.setattr(webhook, "_EXPECTED_AUTH", f"Bearer {SECRET}".encode())
+    return webhook.app.test_client()
+
+
+@pytest.fixture
+def dispatched(monkeypatch):
+    events = []
+    monkeypatch.setattr(webhook, "_dispatch", events.append)
+    return events
+
+
+def test_accepts_configured_secret(client, dispatched):
+    response = client.post("/webhooks/origo", data=b"[]", headers=AUTH)
+    assert response.status_code == 200
+
+
+def test_rejects_wrong_secret(client, dispatched):
+    response = client.post(
+        "/webhooks/origo", data=b"[]", headers={"Authorization": "Bearer wrong"}
+    )
+    assert response.status_code == 401
+
+
+def test_fails_closed_without_secret(monkeypatch, dispatched):
+    monkeypatch.setattr(webhook, "WEBHOOK_SECRET", "")
+    monkeypatch.setattr(webhook, "_EXPECTED_AUTH", b"Bearer ")
+    response = webhook.app.test_client().post(
+        "/webhooks/origo", data=b"[]", headers={"Authorization": "Bearer "}
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.parametrize("streamed", [True, False])
+def test_malformed_events_are_skipped(client, dispatched, monkeypatch, streamed):
+    if not streamed:
+        monkeypatch.setattr(webhook, "ijson", None)
+    elif webhook.ijson is None:
+        pytest.skip("ijson not installed")
+
+    response = client.post("/webhooks/origo", data=BATCH, headers=AUTH)
+
+    assert response.status_code == 200
+    assert sorted(event.id for event in dispatched) == ["no-time", "ok"]
+
+
+class _RawInput:
+    """WSGI input as some servers pass it: read() and readline() only"""
+
+    def __init__(self, body: bytes):
+        self._body = body
+        self._pos = 0
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._body) if size is None or size < 0 else self._pos + size
+        chunk = self._body[self._pos:end]
+        self._pos += len(chunk)
+        return chunk
+
+    def readline(self, size: int = -1) -> bytes:
+        return self.read(size)
+
+
+def test_streams_terminated_raw_input(client, dispatched):
+    if webhook.ijson is None:
+        pytest.skip("ijson not installed")
+
+    response = client.post(
+        "/webhooks/origo",
+        headers=AUTH,
+        environ_overrides={"wsgi.input_terminated": True, "wsgi.input": _RawInput(BATCH)},
+    )
+
+    assert response.status_code == 200
+    assert sorted(event.id for event in dispatched) == ["no-time", "ok"]